@@ -0,0 +1,37 @@
+"""users_lower_email_index
+
+Revision ID: 3f1a9c2d7b10
+Revises: 06d227997eb2
+Create Date: 2026-10-16 09:12:04.118302
+
+"""
+
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '3f1a9c2d7b10'
+down_revision: Union[str, None] = '06d227997eb2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Apply the migration."""
+    # Normalize stored emails so the functional index can be unique
+    op.execute("UPDATE users SET email = lower(email) WHERE email <> lower(email)")
+    op.create_index(
+        'ix_users_lower_email',
+        'users',
+        [sa.text('lower(email)')],
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    """Rollback the migration."""
+    op.drop_index('ix_users_lower_email', table_name='users')
@@ -0,0 +1,92 @@
+"""smallint_status_severity
+
+Revision ID: 8c4e2b7f1a93
+Revises: 3f1a9c2d7b10
+Create Date: 2026-10-16 10:41:27.503118
+
+"""
+
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '8c4e2b7f1a93'
+down_revision: Union[str, None] = '3f1a9c2d7b10'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Frozen copies of src.db.types.ScanStatus / Severity as of this revision;
+# the app enums may grow, this migration must not change with them.
+SCAN_STATUS = {
+    'pending': 1,
+    'running': 2,
+    'processing': 3,
+    'completed': 4,
+    'failed': 5,
+}
+SEVERITY = {
+    'info': 0,
+    'low': 1,
+    'medium': 2,
+    'high': 3,
+    'critical': 4,
+    'warning': 5,
+    'error': 6,
+}
+
+
+def _check_known(table: str, column: str, mapping: dict) -> None:
+    """Refuse to convert if any row holds a value the mapping doesn't cover."""
+    known = ", ".join(f"'{name}'" for name in mapping)
+    rows = op.get_bind().execute(sa.text(
+        f"SELECT DISTINCT {column} FROM {table} "
+        f"WHERE {column} IS NOT NULL AND lower({column}) NOT IN ({known})"
+    )).fetchall()
+    if rows:
+        unknown = ", ".join(repr(row[0]) for row in rows)
+        raise RuntimeError(
+            f"{table}.{column} has values with no integer mapping: {unknown}. "
+            f"Fix or map those rows before running this migration."
+        )
+
+
+def _to_int(column: str, mapping: dict) -> str:
+    whens = " ".join(f"WHEN '{name}' THEN {value}" for name, value in mapping.items())
+    return f"CASE lower({column}) {whens} END"
+
+
+def _to_name(column: str, mapping: dict) -> str:
+    whens = " ".join(f"WHEN {value} THEN '{name}'" for name, value in mapping.items())
+    return f"CASE {column} {whens} END"
+
+
+def upgrade() -> None:
+    """Apply the migration."""
+    _check_known('scans', 'status', SCAN_STATUS)
+    _check_known('findings', 'severity', SEVERITY)
+
+    op.alter_column('scans', 'status', server_default=None)
+    op.alter_column(
+        'scans', 'status',
+        type_=sa.SmallInteger(),
+        postgresql_using=_to_int('status', SCAN_STATUS),
+    )
+    op.alter_column('scans', 'status', server_default=str(SCAN_STATUS['pending']))
+    op.alter_column(
+        'findings', 'severity',
+        type_=sa.SmallInteger(),
+        postgresql_using=_to_int('severity', SEVERITY),
+    )
+
+
+def downgrade() -> None:
+    """Rollback the migration."""
+    op.alter_column('findings', 'severity', type_=sa.String(), postgresql_using=_to_name('severity', SEVERITY))
+    op.alter_column('scans', 'status', server_default=None)
+    op.alter_column('scans', 'status', type_=sa.String(), postgresql_using=_to_name('status', SCAN_STATUS))
+    op.alter_column('scans', 'status', server_default='pending')
@@ -0,0 +1,35 @@
+"""jsonb_raw_data
+
+Revision ID: b51d09e6c2f4
+Revises: 8c4e2b7f1a93
+Create Date: 2026-10-16 11:05:53.214870
+
+"""
+
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = 'b51d09e6c2f4'
+down_revision: Union[str, None] = '8c4e2b7f1a93'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Apply the migration."""
+    op.alter_column('scans', 'extra_data', type_=postgresql.JSONB(), postgresql_using='extra_data::jsonb')
+    op.alter_column('findings', 'raw_data', type_=postgresql.JSONB(), postgresql_using='raw_data::jsonb')
+    op.create_index('ix_findings_raw_gin', 'findings', ['raw_data'], postgresql_using='gin')
+
+
+def downgrade() -> None:
+    """Rollback the migration."""
+    op.drop_index('ix_findings_raw_gin', table_name='findings')
+    op.alter_column('findings', 'raw_data', type_=sa.JSON(), postgresql_using='raw_data::json')
+    op.alter_column('scans', 'extra_data', type_=sa.JSON(), postgresql_using='extra_data::json')
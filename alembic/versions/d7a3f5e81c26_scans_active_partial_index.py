@@ -0,0 +1,36 @@
+"""scans_active_partial_index
+
+Revision ID: d7a3f5e81c26
+Revises: b51d09e6c2f4
+Create Date: 2026-10-16 11:32:08.640915
+
+"""
+
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'd7a3f5e81c26'
+down_revision: Union[str, None] = 'b51d09e6c2f4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Apply the migration."""
+    op.create_index(
+        'ix_scans_active',
+        'scans',
+        ['user_id'],
+        # pending=1, running=2, as frozen in 8c4e2b7f1a93
+        postgresql_where=sa.text("status IN (1, 2)"),
+    )
+
+
+def downgrade() -> None:
+    """Rollback the migration."""
+    op.drop_index('ix_scans_active', table_name='scans')
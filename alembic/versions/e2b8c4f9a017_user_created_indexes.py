@@ -0,0 +1,42 @@
+"""user_created_indexes
+
+Revision ID: e2b8c4f9a017
+Revises: d7a3f5e81c26
+Create Date: 2026-10-16 13:18:44.902561
+
+"""
+
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'e2b8c4f9a017'
+down_revision: Union[str, None] = 'd7a3f5e81c26'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Apply the migration."""
+    op.create_index(
+        'ix_scan_user_created',
+        'scans',
+        ['user_id', sa.text('created_at DESC')],
+        postgresql_using='btree',
+    )
+    op.create_index(
+        'ix_pdfreport_user_created',
+        'pdf_reports',
+        ['user_id', sa.text('created_at DESC')],
+        postgresql_using='btree',
+    )
+
+
+def downgrade() -> None:
+    """Rollback the migration."""
+    op.drop_index('ix_pdfreport_user_created', table_name='pdf_reports')
+    op.drop_index('ix_scan_user_created', table_name='scans')
@@ -2,15 +2,16 @@
 
 from __future__ import annotations
 
-from typing import Generator, Optional
+from typing import AsyncGenerator, Generator, Optional
 
 # Added Request to imports
 from fastapi import Depends, HTTPException, status, Request
 from fastapi.security import OAuth2PasswordBearer
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from src.core.security import get_user_id_from_token
-from src.db.session import get_db
+from src.db.session import get_async_db, get_db
 from src.db.models.user import User
 
 # 1. auto_error=False allows us to check cookies if the header is missing
@@ -25,6 +26,14 @@ def get_db_session() -> Generator[Session, None, None]:
     yield from get_db()
 
 
+async def get_async_db_session() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Async counterpart of `get_db_session` for endpoints that await the DB.
+    """
+    async for db in get_async_db():
+        yield db
+
+
 # 2. New Helper: Tries Header first, then Cookie
 def get_token_from_request(
     request: Request,
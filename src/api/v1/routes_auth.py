@@ -5,9 +5,9 @@ from typing import Any
 from fastapi import APIRouter, Depends, Form, HTTPException, Request, status
 from fastapi.responses import HTMLResponse, RedirectResponse
 from fastapi.security import OAuth2PasswordRequestForm
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.api.deps import get_db_session
+from src.api.deps import get_async_db_session
 from src.core.security import create_access_token
 from src.services.auth_service import (
     authenticate_user,
@@ -36,10 +36,10 @@ async def login_submit_html(
     request: Request,
     email: str = Form(...),    # ✅ Matches <input name="email"> in login.html
     password: str = Form(...), # ✅ Matches <input name="password"> in login.html
-    db: Session = Depends(get_db_session),
+    db: AsyncSession = Depends(get_async_db_session),
 ):
     """Handle login form with secure cookie injection."""
-    user = authenticate_user(db, email, password)
+    user = await authenticate_user(db, email, password)
     templates = request.app.state.templates
 
     if not user:
@@ -82,11 +82,11 @@ async def register_submit_html(
     request: Request,
     email: str = Form(...),
     password: str = Form(...),
-    db: Session = Depends(get_db_session),
+    db: AsyncSession = Depends(get_async_db_session),
 ):
     """Handle registration and auto-login."""
     templates = request.app.state.templates
-    existing = get_user_by_email(db, email=email)
+    existing = await get_user_by_email(db, email=email)
 
     if existing:
         return templates.TemplateResponse(
@@ -99,7 +99,7 @@ async def register_submit_html(
             status_code=status.HTTP_400_BAD_REQUEST,
         )
 
-    user = create_user(db, email=email, password=password)
+    user = await create_user(db, email=email, password=password)
     token = create_access_token(subject=user.id)
     
     response = RedirectResponse(url="/dashboard", status_code=status.HTTP_302_FOUND)
@@ -128,12 +128,12 @@ async def logout(request: Request):
 # -------------------------------------------------
 
 @router.post("/api/login")
-def api_login(
+async def api_login(
     form_data: OAuth2PasswordRequestForm = Depends(),
-    db: Session = Depends(get_db_session),
+    db: AsyncSession = Depends(get_async_db_session),
 ):
     """JSON-based login for API tools/mobile clients."""
-    user = authenticate_user(db, form_data.username, form_data.password)
+    user = await authenticate_user(db, form_data.username, form_data.password)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -4,12 +4,14 @@ import time
 from pathlib import Path
 from typing import List
 
-from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
 from fastapi.responses import FileResponse, HTMLResponse, RedirectResponse
 from pydantic import BaseModel
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from src.api.deps import get_current_user, get_db_session
+from src.api.deps import get_async_db_session, get_current_user, get_db_session
 from src.app.config import get_settings
 from src.db.models.pdf_report import PdfReport
 from src.db.models.user import User
@@ -17,6 +19,7 @@ from src.services.report_service import (
     delete_report_for_user,
     list_reports_for_user,
 )
+from src.utils.pagination import DEFAULT_LIMIT, MAX_LIMIT
 from src.workers.tasks_scans import generate_pdf_report_task
 
 router = APIRouter()
@@ -105,12 +108,14 @@ async def download_report(
 @router.get("/html", response_class=HTMLResponse)
 async def list_reports_page(
     request: Request,
-    db: Session = Depends(get_db_session),
+    skip: int = Query(0, ge=0),
+    limit: int = Query(DEFAULT_LIMIT, ge=1, le=MAX_LIMIT),
+    db: AsyncSession = Depends(get_async_db_session),
     current_user: User = Depends(get_current_user),
 ):
     """Renders the central report repository page."""
     templates = request.app.state.templates
-    reports = list_reports_for_user(db, user_id=current_user.id)
+    reports = await list_reports_for_user(db, user_id=current_user.id, skip=skip, limit=limit)
     return templates.TemplateResponse(
         "reports/list.html",
         {
@@ -136,11 +141,11 @@ async def generate_report_html(
 @router.post("/{report_id}/delete/html")
 async def delete_report_html(
     report_id: int,
-    db: Session = Depends(get_db_session),
+    db: AsyncSession = Depends(get_async_db_session),
     current_user: User = Depends(get_current_user),
 ):
     """Deletes report record and redirects back to list."""
-    success = delete_report_for_user(db, report_id=report_id, user_id=current_user.id)
+    success = await delete_report_for_user(db, report_id=report_id, user_id=current_user.id)
     if not success:
         raise HTTPException(status_code=404, detail="Report deletion failed")
 
@@ -151,15 +156,14 @@ async def delete_report_html(
 
 @router.post("/delete-all/html")
 async def delete_all_reports_html(
-    db: Session = Depends(get_db_session),
+    db: AsyncSession = Depends(get_async_db_session),
     current_user: User = Depends(get_current_user),
 ):
     """Purges all reports for the authenticated user."""
-    reports = db.query(PdfReport).filter(PdfReport.user_id == current_user.id).all()
-    for report in reports:
-        delete_report_for_user(db, report_id=report.id, user_id=current_user.id)
-    
-    db.commit()
+    result = await db.execute(select(PdfReport.id).where(PdfReport.user_id == current_user.id))
+    for report_id in result.scalars().all():
+        await delete_report_for_user(db, report_id=report_id, user_id=current_user.id)
+
     return RedirectResponse(
         url="/api/v1/reports/html", 
         status_code=status.HTTP_302_FOUND
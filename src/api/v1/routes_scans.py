@@ -3,12 +3,14 @@ from datetime import datetime
 import os
 from pathlib import Path
 from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, Request, status, Form
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status, Form
 from fastapi.responses import HTMLResponse, RedirectResponse, FileResponse
 from pydantic import BaseModel
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, selectinload
 
-from src.api.deps import get_current_user, get_db_session
+from src.api.deps import get_async_db_session, get_current_user, get_db_session
 from src.db.models.scan import Scan, Finding
 from src.db.models.pdf_report import PdfReport
 from src.db.models.target import Target
@@ -18,6 +20,7 @@ from src.services.scan_service import (
     get_scan_with_findings,
     list_user_scans,
 )
+from src.utils.pagination import DEFAULT_LIMIT, MAX_LIMIT
 from src.workers.tasks_scans import run_security_scan_task
 
 router = APIRouter()
@@ -66,7 +69,7 @@ async def get_recent_feed(
     current_user: User = Depends(get_current_user),
 ):
     """Returns a partial HTML snippet for the dashboard's live monitor."""
-    recent_scans = db.query(Scan).filter(
+    recent_scans = db.query(Scan).options(selectinload(Scan.target)).filter(
         Scan.user_id == current_user.id
     ).order_by(Scan.created_at.desc()).limit(5).all()
 
@@ -128,11 +131,13 @@ async def get_recent_feed(
 @router.get("/html", response_class=HTMLResponse)
 async def list_scans_page(
     request: Request,
-    db: Session = Depends(get_db_session),
+    skip: int = Query(0, ge=0),
+    limit: int = Query(DEFAULT_LIMIT, ge=1, le=MAX_LIMIT),
+    db: AsyncSession = Depends(get_async_db_session),
     current_user: User = Depends(get_current_user),
 ):
     templates = request.app.state.templates
-    scans = list_user_scans(db, user_id=current_user.id)
+    scans = await list_user_scans(db, user_id=current_user.id, skip=skip, limit=limit)
     return templates.TemplateResponse(
         "scans/list.html",
         {
@@ -146,18 +151,20 @@ async def list_scans_page(
 @router.post("/start/html")
 async def start_scan_html(
     target_id: int = Form(...),
-    db: Session = Depends(get_db_session),
+    db: AsyncSession = Depends(get_async_db_session),
     current_user: User = Depends(get_current_user),
 ):
-    target = db.query(Target).filter(
-        Target.id == target_id, 
-        Target.user_id == current_user.id
-    ).first()
+    result = await db.execute(
+        select(Target).where(Target.id == target_id, Target.user_id == current_user.id)
+    )
+    target = result.scalars().first()
     
     if not target:
         raise HTTPException(status_code=404, detail="Target not found")
 
-    scan = create_scan_for_target(db, user=current_user, target=target)
+    scan = await create_scan_for_target(db, user=current_user, target=target)
+    # Commit before dispatch so the worker can't race ahead of the row
+    await db.commit()
     run_security_scan_task.delay(scan_id=scan.id)
 
     return RedirectResponse(
@@ -240,19 +247,21 @@ async def download_report(
 # -------------------------------------------------
 
 @router.get("/", response_model=List[ScanRead])
-def list_scans(
-    db: Session = Depends(get_db_session),
+async def list_scans(
+    skip: int = Query(0, ge=0),
+    limit: int = Query(DEFAULT_LIMIT, ge=1, le=MAX_LIMIT),
+    db: AsyncSession = Depends(get_async_db_session),
     current_user: User = Depends(get_current_user),
 ):
-    return list_user_scans(db, user_id=current_user.id)
+    return await list_user_scans(db, user_id=current_user.id, skip=skip, limit=limit)
 
 @router.get("/{scan_id}", response_model=ScanDetailSchema)
-def get_scan_detail(
+async def get_scan_detail(
     scan_id: int,
-    db: Session = Depends(get_db_session),
+    db: AsyncSession = Depends(get_async_db_session),
     current_user: User = Depends(get_current_user),
 ):
-    scan = get_scan_with_findings(db, scan_id=scan_id, user_id=current_user.id)
+    scan = await get_scan_with_findings(db, scan_id=scan_id, user_id=current_user.id)
     if not scan:
         raise HTTPException(status_code=404, detail="Scan not found")
     return scan
\ No newline at end of file
@@ -1,5 +1,6 @@
 from __future__ import annotations
 from typing import List, Optional
+from urllib.parse import urlsplit
 
 from fastapi import APIRouter, Depends, HTTPException, Request, status, Form
 from fastapi.responses import HTMLResponse, RedirectResponse
@@ -84,7 +85,7 @@ async def create_target_html(
         url = f'http://{url}'
 
     # Automatically generate a clean display name if none provided
-    display_name = name or url.replace('https://', '').replace('http://', '').split('/')[0]
+    display_name = name or urlsplit(url).netloc
 
     target = Target(
         user_id=current_user.id, 
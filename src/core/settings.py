@@ -69,6 +69,14 @@ class Settings(BaseSettings):
             return list(v)
         return []
 
+    # -------------------------------------------------
+    # Scanner
+    # -------------------------------------------------
+    # Comma-separated nameservers for the CAA check (check 28). Empty means
+    # the host's own resolver, so target names never leave the local DNS
+    # path; set e.g. "1.1.1.1,8.8.8.8" to ask those resolvers instead.
+    CAA_NAMESERVERS: str = ""
+
     # -------------------------------------------------
     # PDF / Reports
     # -------------------------------------------------
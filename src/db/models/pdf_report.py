@@ -2,12 +2,12 @@
 
 from __future__ import annotations
 
-from datetime import datetime
 
-from sqlalchemy import Column, DateTime, ForeignKey, Integer, String
+from sqlalchemy import Column, DateTime, ForeignKey, Index, Integer, String
 from sqlalchemy.orm import relationship
 
 from src.db.base import Base
+from src.utils.misc import utc_now
 
 
 class PdfReport(Base):
@@ -37,15 +37,20 @@ class PdfReport(Base):
     created_at = Column(
         DateTime(timezone=True),
         nullable=False,
-        default=datetime.utcnow,
+        default=utc_now,
     )
 
     # Relationships
     # user uses plural because a user can have many PDF records
-    user = relationship("User", back_populates="pdf_reports")
+    user = relationship("User", back_populates="pdf_reports", lazy="raise")
     
     # ✅ FIXED: Points back to 'report' attribute in your updated Scan model
-    scan = relationship("Scan", back_populates="report")
+    scan = relationship("Scan", back_populates="report", lazy="raise")
+
+    # Serves the per-user "newest first" report listing
+    __table_args__ = (
+        Index("ix_pdfreport_user_created", user_id, created_at.desc()),
+    )
 
     def __repr__(self) -> str:  # pragma: no cover
         return f"<PdfReport id={self.id} scan_id={self.scan_id}>"
\ No newline at end of file
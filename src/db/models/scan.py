@@ -1,9 +1,14 @@
 # src/db/models/scan.py
 from __future__ import annotations
-from datetime import datetime
-from sqlalchemy import Column, DateTime, ForeignKey, Integer, JSON, String, Text
+from sqlalchemy import Column, DateTime, ForeignKey, Index, Integer, JSON, String, Text, text
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
 from src.db.base import Base
+from src.db.types import IntEnumName, ScanStatus, Severity
+from src.utils.misc import utc_now
+
+# Binary JSON on Postgres (no re-parse on read, GIN-indexable); plain JSON elsewhere
+JSONType = JSON().with_variant(JSONB(), "postgresql")
 
 class Scan(Base):
     __tablename__ = "scans"
@@ -11,24 +16,40 @@ class Scan(Base):
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
     target_id = Column(Integer, ForeignKey("targets.id", ondelete="CASCADE"), nullable=False, index=True)
-    status = Column(String(length=50), nullable=False, default="pending")
+    status = Column(IntEnumName(ScanStatus), nullable=False, default="pending")
     started_at = Column(DateTime(timezone=True), nullable=True)
     finished_at = Column(DateTime(timezone=True), nullable=True)
-    created_at = Column(DateTime(timezone=True), nullable=False, default=datetime.utcnow)
+    created_at = Column(DateTime(timezone=True), nullable=False, default=utc_now)
     summary = Column(Text, nullable=True)
-    extra_data = Column(JSON, nullable=True)
+    extra_data = Column(JSONType, nullable=True)
 
     # ✅ Using string references to avoid initialization order issues
-    user = relationship("User", back_populates="scans")
-    target = relationship("Target", back_populates="scans")
-    findings = relationship("Finding", back_populates="scan", cascade="all, delete-orphan")
+    # lazy="raise": every access site must opt in with selectinload() so a
+    # forgotten relationship fails loudly instead of issuing N+1 queries
+    user = relationship("User", back_populates="scans", lazy="raise")
+    target = relationship("Target", back_populates="scans", lazy="raise")
+    findings = relationship("Finding", back_populates="scan", cascade="all, delete-orphan", lazy="raise")
     
     # 1-to-1 relationship for the report record
     report = relationship(
         "PdfReport",
         back_populates="scan",
         cascade="all, delete-orphan",
-        uselist=False
+        uselist=False,
+        lazy="raise",
+    )
+
+    # Only pending/running scans are indexed, so the dashboard's active-scan
+    # lookups stay small as finished scans pile up
+    __table_args__ = (
+        # Serves the per-user "newest first" listings
+        Index("ix_scan_user_created", user_id, created_at.desc()),
+        Index(
+            "ix_scans_active",
+            "user_id",
+            postgresql_where=text(f"status IN ({ScanStatus.pending:d}, {ScanStatus.running:d})"),
+            sqlite_where=text(f"status IN ({ScanStatus.pending:d}, {ScanStatus.running:d})"),
+        ),
     )
 
     def __repr__(self) -> str:
@@ -40,10 +61,15 @@ class Finding(Base):
     scan_id = Column(Integer, ForeignKey("scans.id", ondelete="CASCADE"), nullable=False, index=True)
     check_type = Column(String(length=100), nullable=False)
     name = Column(String(length=255), nullable=False)
-    severity = Column(String(length=50), nullable=False)
+    severity = Column(IntEnumName(Severity), nullable=False)
     description = Column(Text, nullable=True)
     recommendation = Column(Text, nullable=True)
-    raw_data = Column(JSON, nullable=True)
-    created_at = Column(DateTime(timezone=True), nullable=False, default=datetime.utcnow)
+    raw_data = Column(JSONType, nullable=True)
+    created_at = Column(DateTime(timezone=True), nullable=False, default=utc_now)
     
-    scan = relationship("Scan", back_populates="findings")
\ No newline at end of file
+    scan = relationship("Scan", back_populates="findings", lazy="raise")
+
+    # Serves containment filters such as raw_data @> '{"cve": "..."}'
+    __table_args__ = (
+        Index("ix_findings_raw_gin", "raw_data", postgresql_using="gin"),
+    )
\ No newline at end of file
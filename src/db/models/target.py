@@ -2,12 +2,12 @@
 
 from __future__ import annotations
 
-from datetime import datetime
 
 from sqlalchemy import Column, DateTime, ForeignKey, Integer, String
 from sqlalchemy.orm import relationship
 
 from src.db.base import Base
+from src.utils.misc import utc_now
 
 
 class Target(Base):
@@ -26,15 +26,16 @@ class Target(Base):
     created_at = Column(
         DateTime(timezone=True),
         nullable=False,
-        default=datetime.utcnow,
+        default=utc_now,
     )
 
     # Relationships
-    user = relationship("User", back_populates="targets")
+    user = relationship("User", back_populates="targets", lazy="raise")
     scans = relationship(
         "Scan",
         back_populates="target",
         cascade="all, delete-orphan",
+        lazy="raise",
     )
 
     def __repr__(self) -> str:  # pragma: no cover
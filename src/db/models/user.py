@@ -1,8 +1,8 @@
 from __future__ import annotations
-from datetime import datetime
-from sqlalchemy import Boolean, Column, DateTime, Integer, String
+from sqlalchemy import Boolean, Column, DateTime, Index, Integer, String, func
 from sqlalchemy.orm import relationship
 from src.db.base import Base
+from src.utils.misc import utc_now
 
 class User(Base):
     __tablename__ = "users"
@@ -13,15 +13,20 @@ class User(Base):
     is_active = Column(Boolean, nullable=False, default=True)
     is_superuser = Column(Boolean, nullable=False, default=False)
 
-    created_at = Column(DateTime(timezone=True), nullable=False, default=datetime.utcnow)
-    updated_at = Column(DateTime(timezone=True), nullable=False, default=datetime.utcnow)
+    created_at = Column(DateTime(timezone=True), nullable=False, default=utc_now)
+    updated_at = Column(DateTime(timezone=True), nullable=False, default=utc_now)
 
     # Relationships
-    targets = relationship("Target", back_populates="user", cascade="all, delete-orphan")
-    scans = relationship("Scan", back_populates="user", cascade="all, delete-orphan")
+    targets = relationship("Target", back_populates="user", cascade="all, delete-orphan", lazy="raise")
+    scans = relationship("Scan", back_populates="user", cascade="all, delete-orphan", lazy="raise")
     
     # ✅ FIX: Plural 'pdf_reports' matching the PdfReport model
-    pdf_reports = relationship("PdfReport", back_populates="user", cascade="all, delete-orphan")
+    pdf_reports = relationship("PdfReport", back_populates="user", cascade="all, delete-orphan", lazy="raise")
+
+    # Case-insensitive lookups (`lower(email) = :email`) are served by this index
+    __table_args__ = (
+        Index("ix_users_lower_email", func.lower(email), unique=True),
+    )
 
     def __repr__(self) -> str:
         return f"<User id={self.id} email={self.email!r}>"
\ No newline at end of file
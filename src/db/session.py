@@ -1,28 +1,80 @@
 from __future__ import annotations
-from typing import Generator
+from typing import AsyncGenerator, Generator
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker, Session
 from src.core.settings import settings
 
+
+def _pool_args(url: str) -> dict:
+    """Pool sizing for server databases; SQLite's pools reject these arguments."""
+    if make_url(url).get_backend_name() == "sqlite":
+        return {}
+    return {
+        "pool_size": 10,     # Number of permanent connections
+        "max_overflow": 20,  # Extra connections during high traffic
+    }
+
+
 # ✅ THE FIX: Production-grade connection pooling
 engine = create_engine(
     str(settings.DATABASE_URL),
-    pool_size=10,        # Number of permanent connections
-    max_overflow=20,     # Extra connections during high traffic
     pool_pre_ping=True,  # Automatically tests/recovers connections
-    pool_recycle=3600    # Resets connections every hour to prevent timeouts
+    pool_recycle=3600,   # Resets connections every hour to prevent timeouts
+    **_pool_args(str(settings.DATABASE_URL)),
 )
 
+# expire_on_commit=False: objects stay usable after commit without a reload
+# SELECT. Columns filled by a *server* default still need an explicit refresh.
 SessionLocal = sessionmaker(
     autocommit=False,
     autoflush=False,
+    expire_on_commit=False,
     bind=engine,
 )
 
+
+def _async_database_url(url: str) -> str:
+    """Swap the sync driver in DATABASE_URL for its asyncio counterpart."""
+    for prefix in ("postgresql+psycopg2://", "postgresql://"):
+        if url.startswith(prefix):
+            return "postgresql+asyncpg://" + url[len(prefix):]
+    if url.startswith("sqlite://"):
+        return "sqlite+aiosqlite://" + url[len("sqlite://"):]
+    return url
+
+
+# ✅ Async engine: lets the event loop overlap DB waits across requests
+async_engine = create_async_engine(
+    _async_database_url(str(settings.DATABASE_URL)),
+    pool_pre_ping=True,
+    **_pool_args(str(settings.DATABASE_URL)),
+)
+
+AsyncSessionLocal = async_sessionmaker(async_engine, expire_on_commit=False)
+
+
 def get_db() -> Generator[Session, None, None]:
     """Provides a thread-safe database session."""
     db: Session = SessionLocal()
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Provides an AsyncSession bound to the shared async engine.
+
+    One unit of work per request: commit once if the handler succeeds,
+    roll back if it raises. Services only flush.
+    """
+    async with AsyncSessionLocal() as db:
+        try:
+            yield db
+            await db.commit()
+        except Exception:
+            await db.rollback()
+            raise
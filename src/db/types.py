@@ -0,0 +1,57 @@
+# src/db/types.py
+from __future__ import annotations
+
+from enum import IntEnum
+from typing import Any, Optional, Type
+
+from sqlalchemy import SmallInteger
+from sqlalchemy.types import TypeDecorator
+
+
+class Severity(IntEnum):
+    info = 0
+    low = 1
+    medium = 2
+    high = 3
+    critical = 4
+    # Also emitted by the check modules; appended rather than slotted in by
+    # rank so stored values keep their meaning
+    warning = 5
+    error = 6
+
+
+class ScanStatus(IntEnum):
+    pending = 1
+    running = 2
+    processing = 3
+    completed = 4
+    failed = 5
+
+
+class IntEnumName(TypeDecorator):
+    """
+    Stores an IntEnum as a SMALLINT while the ORM keeps working with names.
+
+    Accepts either the member name ("high") or the member itself on the way
+    in and always hands back the lowercase name, so templates, schemas and
+    `Scan.status == "completed"` filters are unchanged.
+    """
+
+    impl = SmallInteger
+    cache_ok = True
+
+    def __init__(self, enum_cls: Type[IntEnum], *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.enum_cls = enum_cls
+
+    def process_bind_param(self, value: Any, dialect) -> Optional[int]:
+        if value is None:
+            return None
+        if isinstance(value, self.enum_cls):
+            return int(value)
+        return int(self.enum_cls[str(value).lower()])
+
+    def process_result_value(self, value: Optional[int], dialect) -> Optional[str]:
+        if value is None:
+            return None
+        return self.enum_cls(value).name
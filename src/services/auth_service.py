@@ -2,19 +2,34 @@
 
 from __future__ import annotations
 
+import asyncio
 from typing import Optional
 
-from sqlalchemy.orm import Session
+from sqlalchemy import bindparam, func, lambda_stmt, select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.security import hash_password, verify_password
 from src.db.models.user import User
 
+# Verified against when the email is unknown so that a miss costs the same
+# bcrypt work as a hit and doesn't reveal which accounts exist.
+DUMMY_HASH = hash_password("dummy-password-for-timing")
 
-def get_user_by_email(db: Session, email: str) -> Optional[User]:
-    return db.query(User).filter(User.email == email).first()
+# Login hot path: lambda_stmt caches the compiled SQL instead of rebuilding
+# it on every call.
+_LOGIN_STMT = lambda_stmt(
+    lambda: select(User)
+    .where(func.lower(User.email) == bindparam("email"))
+    .limit(1)
+)
 
 
-def create_user(db: Session, email: str, password: str) -> User:
+async def get_user_by_email(db: AsyncSession, email: str) -> Optional[User]:
+    result = await db.execute(_LOGIN_STMT, {"email": email.lower()})
+    return result.scalar_one_or_none()
+
+
+async def create_user(db: AsyncSession, email: str, password: str) -> User:
     """
     Create a new user with hashed password.
     """
@@ -25,20 +40,24 @@ def create_user(db: Session, email: str, password: str) -> User:
         is_superuser=False,
     )
     db.add(user)
-    db.commit()
-    db.refresh(user)
+    await db.commit()
+    await db.refresh(user)
     return user
 
 
-def authenticate_user(db: Session, email: str, password: str) -> Optional[User]:
+async def authenticate_user(db: AsyncSession, email: str, password: str) -> Optional[User]:
     """
     Return user if credentials are valid, otherwise None.
     """
-    user = get_user_by_email(db, email=email.lower())
-    if not user:
-        return None
-    if not verify_password(password, user.hashed_password):
+    user = await get_user_by_email(db, email=email)
+    # bcrypt is CPU-bound, run it off the event loop
+    password_ok = await asyncio.to_thread(
+        verify_password,
+        password,
+        user.hashed_password if user else DUMMY_HASH,
+    )
+    if not user or not password_ok:
         return None
     if not user.is_active:
         return None
-    return user
\ No newline at end of file
+    return user
@@ -1,4 +1,5 @@
 import logging
+import os
 from pathlib import Path
 from fpdf import FPDF
 
@@ -166,11 +167,18 @@ def generate_pdf_for_scan(scan, compliance_data, file_prefix="Report", timings=N
         pdf.set_text_color(0, 0, 0)
         pdf.set_y(y + row_height)
 
-    return pdf.output(), f"{file_prefix}.pdf"
+    return bytes(pdf.output()), f"{file_prefix}.pdf"
 
 def save_pdf_file(pdf_bytes: bytes, filename: str) -> str:
     output_dir = Path("/app/pdf_reports")
     output_dir.mkdir(parents=True, exist_ok=True)
     file_path = output_dir / filename
-    file_path.write_bytes(pdf_bytes)
-    return str(file_path)
\ No newline at end of file
+    # Owner read/write, group read; write straight from the buffer without a copy
+    fd = os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o640)
+    try:
+        view = memoryview(pdf_bytes)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+    return str(file_path)
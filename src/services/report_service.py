@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from pathlib import Path
 from typing import List, Optional
 
-from sqlalchemy.orm import Session
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 
 from src.core.settings import get_settings
 from src.db.models.pdf_report import PdfReport
@@ -17,35 +20,42 @@ logger = logging.getLogger(__name__)
 settings = get_settings()
 
 
-def list_reports_for_user(db: Session, user_id: int) -> List[PdfReport]:
+async def list_reports_for_user(
+    db: AsyncSession,
+    user_id: int,
+    skip: int = 0,
+    limit: Optional[int] = None,
+) -> List[PdfReport]:
     """
-    Return all PDF reports for a given user, newest first.
+    Return a user's PDF reports, newest first, optionally one window of them.
     """
-    return (
-        db.query(PdfReport)
-        .filter(PdfReport.user_id == user_id)
+    result = await db.execute(
+        select(PdfReport)
+        .options(selectinload(PdfReport.scan), selectinload(PdfReport.user))
+        .where(PdfReport.user_id == user_id)
         .order_by(PdfReport.created_at.desc())
-        .all()
+        .offset(skip)
+        .limit(limit)
     )
+    return list(result.scalars().all())
 
 
-def get_report_for_user(
-    db: Session,
+async def get_report_for_user(
+    db: AsyncSession,
     report_id: int,
     user_id: int,
 ) -> Optional[PdfReport]:
     """
     Fetch a specific report ensuring it belongs to the authenticated user.
     """
-    return (
-        db.query(PdfReport)
-        .filter(PdfReport.id == report_id, PdfReport.user_id == user_id)
-        .first()
+    result = await db.execute(
+        select(PdfReport).where(PdfReport.id == report_id, PdfReport.user_id == user_id)
     )
+    return result.scalars().first()
 
 
-def create_report_record(
-    db: Session,
+async def create_report_record(
+    db: AsyncSession,
     *,
     user_id: int,
     scan_id: int,
@@ -60,13 +70,29 @@ def create_report_record(
         file_path=file_path,
     )
     db.add(report)
-    db.commit()
-    db.refresh(report)
+    await db.flush()  # assigns report.id; the request boundary commits
     return report
 
 
-def delete_report_for_user(
-    db: Session,
+def _unlink_report_file(file_path: str) -> None:
+    # ✅ PATH RESOLUTION: Use filename only to prevent double-nesting errors
+    filename = Path(file_path).name
+    
+    # Use settings if available, otherwise fallback to standard Docker volume path
+    storage_dir = Path(getattr(settings, 'PDF_OUTPUT_DIR', '/app/pdf_reports'))
+    physical_path = storage_dir / filename
+
+    try:
+        physical_path.unlink()
+        logger.info(f"Successfully unlinked physical PDF: {physical_path}")
+    except FileNotFoundError:
+        logger.warning(f"File system mismatch: {physical_path} not found. Deleted DB record only.")
+    except Exception as e:
+        logger.error(f"OS Error unlinking {physical_path}: {str(e)}")
+
+
+async def delete_report_for_user(
+    db: AsyncSession,
     report_id: int,
     user_id: int,
 ) -> bool:
@@ -74,35 +100,26 @@ def delete_report_for_user(
     Delete report record and the physical file from shared Docker storage.
     Standardized to look in /app/pdf_reports for cross-container consistency.
     """
-    report = get_report_for_user(db, report_id=report_id, user_id=user_id)
-    if not report:
+    # Single DELETE ... RETURNING instead of SELECT + DELETE
+    result = await db.execute(
+        delete(PdfReport)
+        .where(PdfReport.id == report_id, PdfReport.user_id == user_id)
+        .returning(PdfReport.file_path)
+        .execution_options(synchronize_session=False)
+    )
+    file_path = result.scalar_one_or_none()
+    if file_path is None:
         logger.warning(f"Delete attempt failed: Report {report_id} not found for user {user_id}")
         return False
+    await db.commit()
 
-    # ✅ PATH RESOLUTION: Use filename only to prevent double-nesting errors
-    filename = Path(report.file_path).name
-    
-    # Use settings if available, otherwise fallback to standard Docker volume path
-    storage_dir = Path(getattr(settings, 'PDF_OUTPUT_DIR', '/app/pdf_reports'))
-    physical_path = storage_dir / filename
-
-    if physical_path.exists():
-        try:
-            physical_path.unlink()
-            logger.info(f"Successfully unlinked physical PDF: {physical_path}")
-        except Exception as e:
-            logger.error(f"OS Error unlinking {physical_path}: {str(e)}")
-            # We continue to DB deletion so the UI doesn't get stuck with a broken record
-    else:
-        logger.warning(f"File system mismatch: {physical_path} not found. Deleting DB record only.")
-
-    db.delete(report)
-    db.commit()
+    # The row is gone either way, so a missing/locked file never leaves a broken record
+    await asyncio.to_thread(_unlink_report_file, file_path)
     return True
 
 
-def get_scan_owned_by_user(
-    db: Session,
+async def get_scan_owned_by_user(
+    db: AsyncSession,
     *,
     scan_id: int,
     user_id: int,
@@ -110,8 +127,7 @@ def get_scan_owned_by_user(
     """
     Helper: verify scan ownership before report generation.
     """
-    return (
-        db.query(Scan)
-        .filter(Scan.id == scan_id, Scan.user_id == user_id)
-        .first()
-    )
\ No newline at end of file
+    result = await db.execute(
+        select(Scan).where(Scan.id == scan_id, Scan.user_id == user_id)
+    )
+    return result.scalars().first()
\ No newline at end of file
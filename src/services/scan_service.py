@@ -2,17 +2,19 @@
 
 from __future__ import annotations
 
-from datetime import datetime
-from typing import List, Optional
+from typing import Iterable, List, Optional
 
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, selectinload
 
 from src.db.models.scan import Finding, Scan
 from src.db.models.target import Target
 from src.db.models.user import User
+from src.utils.misc import utc_now
 
 
-def create_scan_for_target(db: Session, user: User, target: Target) -> Scan:
+async def create_scan_for_target(db: AsyncSession, user: User, target: Target) -> Scan:
     """
     Create a new Scan row for a given user + target.
     """
@@ -20,87 +22,98 @@ def create_scan_for_target(db: Session, user: User, target: Target) -> Scan:
         user_id=user.id,
         target_id=target.id,
         status="pending",
-        created_at=datetime.utcnow(),
+        created_at=utc_now(),
     )
     db.add(scan)
-    db.commit()
-    db.refresh(scan)
+    await db.flush()  # assigns scan.id; the request boundary commits
     return scan
 
 
-def mark_scan_started(db: Session, scan: Scan) -> Scan:
-    scan.status = "running"
-    scan.started_at = datetime.utcnow()
-    db.add(scan)
-    db.commit()
-    db.refresh(scan)
+async def _update_scan_state(db: AsyncSession, scan: Scan, **fields) -> Scan:
+    """
+    Apply a status transition; the caller's unit of work commits it.
+
+    The scan is already persistent, so no db.add() is needed, and nothing on
+    `scans` is server-defaulted on UPDATE, so no db.refresh() either.
+    """
+    for key, value in fields.items():
+        setattr(scan, key, value)
+    await db.flush()
     return scan
 
 
-def mark_scan_completed(
-    db: Session,
+async def mark_scan_started(db: AsyncSession, scan: Scan) -> Scan:
+    return await _update_scan_state(db, scan, status="running", started_at=utc_now())
+
+
+async def mark_scan_completed(
+    db: AsyncSession,
     scan: Scan,
     summary: str | None = None,
     extra_data: dict | None = None,
 ) -> Scan:
-    scan.status = "completed"
-    scan.finished_at = datetime.utcnow()
+    fields = {"status": "completed", "finished_at": utc_now()}
     if summary is not None:
-        scan.summary = summary
+        fields["summary"] = summary
     if extra_data is not None:
-        scan.extra_data = extra_data
-    db.add(scan)
-    db.commit()
-    db.refresh(scan)
-    return scan
+        fields["extra_data"] = extra_data
+    return await _update_scan_state(db, scan, **fields)
 
 
-def mark_scan_failed(
-    db: Session,
+async def mark_scan_failed(
+    db: AsyncSession,
     scan: Scan,
     error_message: str | None = None,
     extra_data: dict | None = None,
 ) -> Scan:
-    scan.status = "failed"
-    scan.finished_at = datetime.utcnow()
+    fields = {"status": "failed", "finished_at": utc_now()}
     if error_message:
-        scan.summary = error_message
+        fields["summary"] = error_message
     if extra_data is not None:
-        scan.extra_data = extra_data
-    db.add(scan)
-    db.commit()
-    db.refresh(scan)
-    return scan
+        fields["extra_data"] = extra_data
+    return await _update_scan_state(db, scan, **fields)
 
 
-def list_user_scans(db: Session, user_id: int) -> List[Scan]:
+async def list_user_scans(
+    db: AsyncSession,
+    user_id: int,
+    skip: int = 0,
+    limit: Optional[int] = None,
+) -> List[Scan]:
     """
-    Return all scans for a given user, newest first.
+    Return a user's scans, newest first, optionally one window of them.
     """
-    return (
-        db.query(Scan)
-        .filter(Scan.user_id == user_id)
+    result = await db.execute(
+        select(Scan)
+        .options(selectinload(Scan.target), selectinload(Scan.report))
+        .where(Scan.user_id == user_id)
         .order_by(Scan.created_at.desc())
-        .all()
+        .offset(skip)
+        .limit(limit)
     )
+    return list(result.scalars().all())
 
 
-def get_scan_with_findings(
-    db: Session,
+async def get_scan_with_findings(
+    db: AsyncSession,
     scan_id: int,
     user_id: int,
 ) -> Optional[Scan]:
     """
     Fetch a specific scan for a user, including findings.
     """
-    return (
-        db.query(Scan)
-        .options(joinedload(Scan.findings))
-        .filter(Scan.id == scan_id, Scan.user_id == user_id)
-        .first()
+    result = await db.execute(
+        select(Scan)
+        .options(selectinload(Scan.findings))
+        .where(Scan.id == scan_id, Scan.user_id == user_id)
     )
+    return result.scalars().first()
 
 
+# -------------------------------------------------
+# Worker-side helpers (sync Session, used from Celery tasks)
+# -------------------------------------------------
+
 def add_finding(
     db: Session,
     scan: Scan,
@@ -114,18 +127,36 @@ def add_finding(
 ) -> Finding:
     """
     Create and attach a Finding to the given scan.
+
+    For more than one finding use add_findings_bulk.
     """
-    finding = Finding(
-        scan_id=scan.id,
-        check_type=check_type,
-        name=name,
-        severity=severity,
-        description=description,
-        recommendation=recommendation,
-        raw_data=raw_data,
-        created_at=datetime.utcnow(),
-    )
-    db.add(finding)
-    db.commit()
-    db.refresh(finding)
-    return finding
\ No newline at end of file
+    return add_findings_bulk(
+        db,
+        scan,
+        [
+            dict(
+                check_type=check_type,
+                name=name,
+                severity=severity,
+                description=description,
+                recommendation=recommendation,
+                raw_data=raw_data,
+            )
+        ],
+    )[0]
+
+
+def add_findings_bulk(
+    db: Session,
+    scan: Scan,
+    findings: Iterable[dict],
+) -> List[Finding]:
+    """
+    Insert a batch of findings for a scan in one round-trip. The caller
+    commits, so the batch joins whatever transaction it is part of.
+    """
+    now = utc_now()
+    rows = [Finding(scan_id=scan.id, created_at=now, **data) for data in findings]
+    # return_defaults populates the primary keys on the returned objects
+    db.bulk_save_objects(rows, return_defaults=True)
+    return rows
@@ -0,0 +1,131 @@
+# src/app/services/security_checks/_cache.py
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple, Union
+
+import requests
+
+from . import HTTP_TIMEOUT, SESSION
+
+CACHE_MAXSIZE = 256
+CACHE_TTL_SECONDS = 30
+
+_cache: "OrderedDict[Tuple[str, str, bool], Tuple[float, requests.Response]]" = OrderedDict()
+_lock = threading.Lock()
+# One lock per in-flight key so concurrent callers wait for the first fetch
+# instead of repeating it; dropped once the fetch settles, so it never outgrows
+# the number of concurrent fetches
+_key_locks: Dict[Tuple[str, str, bool], threading.Lock] = {}
+
+
+def _lookup(key: Tuple[str, str, bool], now: float) -> Optional[requests.Response]:
+    # A full GET also satisfies a headers-only lookup
+    kind, url, verify = key
+    candidates = [key] if kind == "GET" else [key, ("GET", url, verify)]
+    with _lock:
+        for candidate in candidates:
+            entry = _cache.get(candidate)
+            if entry is None:
+                continue
+            expires_at, response = entry
+            if expires_at > now:
+                _cache.move_to_end(candidate)
+                return response
+            _cache.pop(candidate, None)
+    return None
+
+
+def _fetch(
+    session: requests.Session,
+    url: str,
+    timeout: Union[float, Tuple[float, float]],
+    headers_only: bool,
+    verify: bool,
+) -> requests.Response:
+    if headers_only:
+        response = session.get(url, timeout=timeout, verify=verify, stream=True)
+        response.close()  # drop the body; headers are already parsed
+    else:
+        response = session.get(url, timeout=timeout, verify=verify)
+        response.content  # read the body now so the cached object is self-contained
+    return response
+
+
+def cached_get(
+    url: str,
+    session: Optional[requests.Session] = None,
+    timeout: Union[float, Tuple[float, float]] = HTTP_TIMEOUT,
+    headers_only: bool = False,
+    verify: bool = True,
+) -> requests.Response:
+    """
+    GET through the shared session, memoized per URL for a short TTL.
+
+    Checks in the same scan (and repeat scans a few seconds apart) that look
+    at the same page get the already-downloaded response back; a check that
+    asks while the first fetch is still in flight waits for it rather than
+    sending its own. Failed requests are not cached.
+
+    headers_only=True streams the response and closes it after the headers
+    arrive, so header-only checks never download the body. It is still a GET
+    (not HEAD) because some servers only emit security headers on GET.
+
+    Only the shared SESSION is cached. A caller passing its own session
+    (other headers, cookies or adapters) always gets a fresh fetch through it.
+    """
+    if session is not None and session is not SESSION:
+        return _fetch(session, url, timeout, headers_only, verify)
+
+    key = ("HEADERS" if headers_only else "GET", url, verify)
+    response = _lookup(key, time.monotonic())
+    if response is not None:
+        return response
+
+    with _lock:
+        key_lock = _key_locks.setdefault(key, threading.Lock())
+
+    with key_lock:
+        now = time.monotonic()
+        response = _lookup(key, now)
+        if response is not None:
+            return response
+
+        try:
+            response = _fetch(SESSION, url, timeout, headers_only, verify)
+            with _lock:
+                _cache[key] = (now + CACHE_TTL_SECONDS, response)
+                _cache.move_to_end(key)
+                while len(_cache) > CACHE_MAXSIZE:
+                    _cache.popitem(last=False)
+        finally:
+            # Later callers find the cached response (or retry a failure) without this lock
+            with _lock:
+                if _key_locks.get(key) is key_lock:
+                    del _key_locks[key]
+        return response
+
+
+def header_response(
+    url: str,
+    session: Optional[requests.Session] = None,
+    response: Optional[requests.Response] = None,
+) -> requests.Response:
+    """
+    The response a header check should inspect.
+
+    master_runner hands its RESPONSE_CHECKS one pre-fetched GET to share; a
+    check called on its own falls back to a headers-only cached_get.
+    """
+    if response is not None:
+        return response
+    return cached_get(url, session=session, headers_only=True)
+
+
+def clear() -> None:
+    with _lock:
+        _cache.clear()
+        _key_locks.clear()
@@ -0,0 +1,148 @@
+# src/app/services/security_checks/_dns.py
+
+from __future__ import annotations
+
+import socket
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, List, Tuple
+
+DNS_TTL_SECONDS = 60
+DNS_CACHE_MAXSIZE = 1024
+
+# Staged socket budget: a healthy target connects and handshakes in well under
+# 100 ms, so an unreachable or stalled one is given up on quickly.
+CONNECT_TIMEOUT = 1.0
+HANDSHAKE_TIMEOUT = 2.0
+IO_TIMEOUT = 0.5
+REACHABILITY_TIMEOUT = CONNECT_TIMEOUT
+# Port sweep connects are all in flight at once, so a filtered port costs this once per scan
+SWEEP_TIMEOUT = 2.0
+
+_cache: "OrderedDict[Tuple[str, int], Tuple[float, Tuple[int, tuple]]]" = OrderedDict()
+_lock = threading.Lock()
+# host:port pairs a recent probe_port() could not reach
+_unreachable: "OrderedDict[Tuple[str, int], float]" = OrderedDict()
+
+
+def _remember(table: OrderedDict, key: Tuple[str, int], value) -> None:
+    # Caller holds _lock. Least recently stored entries go first once full.
+    table[key] = value
+    table.move_to_end(key)
+    while len(table) > DNS_CACHE_MAXSIZE:
+        table.popitem(last=False)
+
+
+def resolve(host: str, port: int = 443) -> Tuple[int, tuple]:
+    """
+    (family, sockaddr) for `host:port`, memoized for a short TTL.
+
+    Every TLS check dials the same host, so one getaddrinfo per scan is
+    enough. Lookup failures raise socket.gaierror and are not cached.
+    """
+    key = (host, port)
+    now = time.monotonic()
+    with _lock:
+        entry = _cache.get(key)
+        if entry is not None:
+            if entry[0] > now:
+                return entry[1]
+            del _cache[key]
+
+    family, _type, _proto, _canon, sockaddr = socket.getaddrinfo(
+        host, port, type=socket.SOCK_STREAM
+    )[0]
+    with _lock:
+        _remember(_cache, key, (now + DNS_TTL_SECONDS, (family, sockaddr)))
+    return family, sockaddr
+
+
+def probe_port(host: str, port: int = 443, timeout: float = REACHABILITY_TIMEOUT) -> bool:
+    """
+    One quick TCP connect to `host:port`, run once at the start of a scan.
+
+    A failure is remembered for DNS_TTL_SECONDS so connect() refuses
+    straight away instead of every TLS check sitting out its own timeout.
+    """
+    key = (host, port)
+    try:
+        family, sockaddr = resolve(host, port)
+        with socket.socket(family, socket.SOCK_STREAM) as sock:
+            sock.settimeout(timeout)
+            sock.connect(sockaddr)
+    except OSError:
+        with _lock:
+            _remember(_unreachable, key, time.monotonic() + DNS_TTL_SECONDS)
+        return False
+    with _lock:
+        _unreachable.pop(key, None)
+    return True
+
+
+def connect(
+    host: str,
+    port: int = 443,
+    timeout: float = CONNECT_TIMEOUT,
+    io_timeout: float = HANDSHAKE_TIMEOUT,
+) -> socket.socket:
+    """
+    Like socket.create_connection((host, port)) but on the cached address.
+
+    `timeout` bounds the TCP connect; the returned socket then carries
+    `io_timeout`, which covers the TLS handshake that usually follows.
+    Callers tighten it further (IO_TIMEOUT) for their own reads.
+    """
+    with _lock:
+        expires_at = _unreachable.get((host, port))
+        if expires_at is not None and expires_at <= time.monotonic():
+            del _unreachable[(host, port)]
+            expires_at = None
+    if expires_at is not None:
+        raise ConnectionRefusedError(f"{host}:{port} did not answer the reachability probe")
+
+    family, sockaddr = resolve(host, port)
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    try:
+        # Handshake records are small back-to-back writes; don't let Nagle hold
+        # one back waiting for the peer's ACK
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        sock.settimeout(timeout)
+        sock.connect(sockaddr)
+        sock.settimeout(io_timeout)
+    except BaseException:
+        sock.close()
+        raise
+    return sock
+
+
+def _port_open(family: int, sockaddr: tuple, timeout: float) -> bool:
+    with socket.socket(family, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        return sock.connect_ex(sockaddr) == 0
+
+
+def sweep_ports(host: str, ports: Iterable[int], timeout: float = SWEEP_TIMEOUT) -> List[int]:
+    """
+    The subset of `ports` on `host` that accept a TCP connect, in input order.
+
+    Every port is dialed side by side on the one cached address, so the
+    sweep takes about as long as the slowest (filtered) port. Raises
+    socket.gaierror if the host doesn't resolve.
+    """
+    ports = list(ports)
+    if not ports:
+        return []
+    family, sockaddr = resolve(host)
+    # Same address, different port; keeps the IPv6 flowinfo/scope_id fields
+    addrs = [(sockaddr[0], port) + tuple(sockaddr[2:]) for port in ports]
+    with ThreadPoolExecutor(max_workers=len(ports)) as executor:
+        is_open = list(executor.map(lambda addr: _port_open(family, addr, timeout), addrs))
+    return [port for port, ok in zip(ports, is_open) if ok]
+
+
+def clear() -> None:
+    with _lock:
+        _cache.clear()
+        _unreachable.clear()
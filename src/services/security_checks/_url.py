@@ -0,0 +1,45 @@
+# src/app/services/security_checks/_url.py
+
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Optional, Tuple
+from urllib.parse import urlsplit
+
+DEFAULT_PORTS = {"http": 80, "https": 443}
+
+
+@lru_cache(maxsize=256)
+def parse_target(url: str) -> Tuple[str, int, str]:
+    """
+    (host, port, scheme) of a target URL; bare hosts are treated as https://.
+
+    Unlike stripping the scheme by hand this drops credentials, keeps an
+    explicit port and unwraps IPv6 literals. Cached since every check is
+    handed the same URL.
+    """
+    parts = urlsplit(url if "://" in url else "https://" + url)
+    scheme = (parts.scheme or "https").lower()
+    port = parts.port or DEFAULT_PORTS.get(scheme, 443)
+    return parts.hostname or "", port, scheme
+
+
+def host_of(url: str) -> str:
+    """Hostname of a target URL (see parse_target)."""
+    return parse_target(url)[0]
+
+
+def origin_of(url: str, scheme: Optional[str] = None) -> str:
+    """
+    `scheme://host[:port]` for the target, optionally forcing another scheme.
+
+    A non-default port is kept only when the scheme is unchanged; forcing
+    http:// or https:// otherwise means that scheme's default port.
+    """
+    host, port, original = parse_target(url)
+    scheme = scheme or original
+    if ":" in host:
+        host = f"[{host}]"
+    if scheme == original and port != DEFAULT_PORTS.get(scheme):
+        return f"{scheme}://{host}:{port}"
+    return f"{scheme}://{host}"
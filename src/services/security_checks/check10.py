@@ -1,6 +1,13 @@
+import re
+
 import requests
 
-def run_check(target_url):
+from ._cache import header_response
+
+# One pass over the header instead of a lowercase copy + one scan per keyword
+_WEAK_CSP_RE = re.compile(r"unsafe-inline|unsafe-eval|\*", re.I)
+
+def run_check(target_url=None, session=None, response=None):
     """
     Compliance Check: Content-Security-Policy (CSP)
     - Success: Strong CSP defined (Compliant - Y)
@@ -8,7 +15,7 @@ def run_check(target_url):
     - Failure: CSP missing (Not Compliant - N)
     """
     try:
-        response = requests.get(target_url, timeout=10)
+        response = header_response(target_url, session, response)
         # Headers are case-insensitive
         csp = response.headers.get('Content-Security-Policy', '')
 
@@ -27,8 +34,7 @@ def run_check(target_url):
         # 'unsafe-inline' allows execution of inline scripts (huge XSS risk)
         # 'unsafe-eval' allows string-to-code execution
         # '*' allows loading data from any domain in the world
-        weak_keywords = ["unsafe-inline", "unsafe-eval", "*"]
-        found_weakness = [word for word in weak_keywords if word in csp.lower()]
+        found_weakness = list(dict.fromkeys(m.lower() for m in _WEAK_CSP_RE.findall(csp)))
 
         if found_weakness:
             return {
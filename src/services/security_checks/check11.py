@@ -1,19 +1,25 @@
+import re
+
 import requests
 
-def run_check(target_url):
+from ._cache import header_response
+
+# Cookie names that suggest a dynamic (session-bearing) site
+_DYN_RE = re.compile(r"session|id|token|user|sid", re.I)
+
+def run_check(target_url=None, session=None, response=None):
     """
     Compliance Check: Cookie Security (HttpOnly and Secure)
     - Dynamic Sites: Both MUST be true. If ANY are false = Red N.
     - Static Sites: If any are false = Yellow Y.
     """
     try:
-        response = requests.get(target_url, timeout=10)
+        response = header_response(target_url, session, response)
         # Get all Set-Cookie headers
         cookies = response.headers.get('Set-Cookie', '')
-        content_type = response.headers.get('Content-Type', '').lower()
 
         # Simple heuristic to identify dynamic sites (Cookies like 'session', 'id', 'token')
-        is_dynamic = any(x in cookies.lower() for x in ['session', 'id', 'token', 'user', 'sid'])
+        is_dynamic = bool(_DYN_RE.search(cookies))
 
         if not cookies:
             return {
@@ -23,8 +29,9 @@ def run_check(target_url):
                 "severity": "info" # Green
             }
 
-        has_http_only = "httponly" in cookies.lower()
-        has_secure = "secure" in cookies.lower()
+        cookie_lower = cookies.lower()
+        has_http_only = "httponly" in cookie_lower
+        has_secure = "secure" in cookie_lower
 
         # --- Compliance Logic ---
 
@@ -1,6 +1,15 @@
+import re
+
 import requests
 
-def run_check(target_url):
+from ._cache import header_response
+
+# Cookie names that suggest a dynamic (session-bearing) site
+_DYN_RE = re.compile(r"session|id|token|user|sid|auth", re.I)
+# Every SameSite value across all Set-Cookie entries, in one pass
+_SAMESITE_RE = re.compile(r"samesite=(strict|lax|none)", re.I)
+
+def run_check(target_url=None, session=None, response=None):
     """
     Compliance Check: SameSite Cookie Attribute
     - Dynamic Sites: Must be 'Strict' or 'Lax' (Green Y). If 'None' or missing = Red N.
@@ -8,11 +17,11 @@ def run_check(target_url):
     - Standards: OWASP CSRF Prevention Cheat Sheet.
     """
     try:
-        response = requests.get(target_url, timeout=10)
+        response = header_response(target_url, session, response)
         cookies = response.headers.get('Set-Cookie', '')
         
         # Heuristic to identify dynamic sites (looking for session identifiers)
-        is_dynamic = any(x in cookies.lower() for x in ['session', 'id', 'token', 'user', 'sid', 'auth'])
+        is_dynamic = bool(_DYN_RE.search(cookies))
 
         # If no cookies are set at all
         if not cookies:
@@ -24,11 +33,10 @@ def run_check(target_url):
             }
 
         # Check for SameSite values
-        cookie_lower = cookies.lower()
-        is_strict = "samesite=strict" in cookie_lower
-        is_lax = "samesite=lax" in cookie_lower
-        is_none = "samesite=none" in cookie_lower
-        has_samesite = "samesite" in cookie_lower
+        samesite_values = {value.lower() for value in _SAMESITE_RE.findall(cookies)}
+        is_strict = "strict" in samesite_values
+        is_lax = "lax" in samesite_values
+        is_none = "none" in samesite_values
 
         # --- Compliance Logic ---
 
@@ -1,6 +1,8 @@
 import requests
 
-def run_check(target_url):
+from ._cache import header_response
+
+def run_check(target_url=None, session=None, response=None):
     """
     Compliance Check: Cache-Control Headers
     - Success: Header present and restricts sensitive caching (Compliant - Y)
@@ -8,7 +10,7 @@ def run_check(target_url):
     - Failure: Header missing (Not Compliant - N)
     """
     try:
-        response = requests.get(target_url, timeout=10)
+        response = header_response(target_url, session, response)
         cache_header = response.headers.get('Cache-Control', '').lower()
         pragma_header = response.headers.get('Pragma', '').lower()
 
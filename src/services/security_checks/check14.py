@@ -1,12 +1,17 @@
+from concurrent.futures import ThreadPoolExecutor
+
 import requests
 
-def run_check(target_url):
+from . import SESSION
+
+def run_check(target_url, session=None):
     """
     Compliance Check: Insecure HTTP Methods
     - Tests for dangerous methods: PUT, DELETE, TRACE, OPTIONS, CONNECT.
     - Success: Server returns 405 Method Not Allowed or 403 Forbidden (Compliant - Y).
     - Failure: Server accepts the method (200, 201, 204) (Not Compliant - N).
     """
+    session = session or SESSION
     dangerous_methods = ['PUT', 'DELETE', 'TRACE', 'CONNECT']
     allowed_but_check = ['OPTIONS'] # Often used for CORS, but can leak info
     
@@ -16,16 +21,19 @@ def run_check(target_url):
         # Standardize URL
         clean_url = target_url if target_url.startswith('http') else f"https://{target_url}"
 
-        for method in dangerous_methods:
+        def _probe(method):
             try:
                 # We send a dummy request for each method
-                response = requests.request(method, clean_url, timeout=5)
-                
+                return method, session.request(method, clean_url, timeout=5).status_code
+            except requests.exceptions.RequestException:
+                return method, None
+
+        # Fire all probes at once: worst case is one timeout, not one per method
+        with ThreadPoolExecutor(max_workers=len(dangerous_methods)) as executor:
+            for method, status_code in executor.map(_probe, dangerous_methods):
                 # If the status code is 2xx, the method is ACTIVE and insecure
-                if 200 <= response.status_code < 300:
+                if status_code is not None and 200 <= status_code < 300:
                     found_methods.append(method)
-            except requests.exceptions.RequestException:
-                continue
 
         # --- Compliance Logic ---
 
@@ -1,12 +1,17 @@
+from concurrent.futures import ThreadPoolExecutor
+
 import requests
 
-def run_check(target_url):
+from . import SESSION
+
+def run_check(target_url, session=None):
     """
     Compliance Check: Management/CMS Interface Exposure
     - Scans for common admin paths (wp-admin, phpmyadmin, admin, etc.)
     - Success: 404 Not Found or 403 Forbidden (Compliant - Y)
     - Failure: 200 OK (Not Compliant - N)
     """
+    session = session or SESSION
     # Common administrative paths to check
     admin_paths = [
         '/admin', '/wp-admin', '/phpmyadmin', '/controlpanel', 
@@ -14,20 +19,22 @@ def run_check(target_url):
         '/admin.php', '/magento/admin'
     ]
     
-    exposed_paths = []
     clean_url = target_url.rstrip('/')
 
+    def _probe(path):
+        try:
+            # We use a 5-second timeout to avoid hanging the scan
+            return path, session.head(f"{clean_url}{path}", timeout=5, allow_redirects=True).status_code
+        except requests.exceptions.RequestException:
+            return path, None
+
     try:
-        for path in admin_paths:
-            try:
-                # We use a 5-second timeout to avoid hanging the scan
-                response = requests.head(f"{clean_url}{path}", timeout=5, allow_redirects=True)
-                
-                # If the page exists (200 OK) or requires login (401), it is "Exposed"
-                if response.status_code == 200:
-                    exposed_paths.append(path)
-            except requests.exceptions.RequestException:
-                continue
+        # All paths hit the same host over the pooled session, so sweep them at once
+        with ThreadPoolExecutor(max_workers=len(admin_paths)) as executor:
+            results = list(executor.map(_probe, admin_paths))
+
+        # If the page exists (200 OK) it is "Exposed"
+        exposed_paths = [path for path, status_code in results if status_code == 200]
 
         # --- Compliance Logic ---
 
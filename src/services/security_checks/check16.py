@@ -1,5 +1,41 @@
 import ssl
 import socket
+from concurrent.futures import ThreadPoolExecutor
+
+from ._dns import connect
+from ._url import host_of
+
+# Map of weak protocols to test
+WEAK_PROTOCOLS = {
+    "SSLv2": ssl.PROTOCOL_SSLv23, # Historically used to probe older versions
+    "SSLv3": ssl.PROTOCOL_SSLv3 if hasattr(ssl, 'PROTOCOL_SSLv3') else None,
+    "TLSv1": ssl.PROTOCOL_TLSv1,
+    "TLSv1.1": ssl.PROTOCOL_TLSv1_1
+}
+
+def _build_contexts():
+    contexts = {}
+    for name, proto in WEAK_PROTOCOLS.items():
+        if proto is None: continue # Skip if Python build doesn't even support the old protocol
+        try:
+            contexts[name] = ssl.SSLContext(proto)
+        except (ssl.SSLError, ValueError):
+            continue
+    return contexts
+
+# Built once at import; SSLContext construction is expensive and contexts are reusable
+_CONTEXTS = _build_contexts()
+
+def _probe(name, host, port):
+    """Return `name` if the server completes a handshake with that protocol, else None."""
+    try:
+        with connect(host, port) as sock:
+            with _CONTEXTS[name].wrap_socket(sock, server_hostname=host) as ssock:
+                # If we get here, the connection was successful using a weak protocol
+                return name
+    except (ssl.SSLError, socket.timeout, ConnectionRefusedError, OSError):
+        # This is GOOD. It means the server rejected the weak protocol.
+        return None
 
 def run_check(target_url):
     """
@@ -9,31 +45,12 @@ def run_check(target_url):
     - Failure: Connection established using weak protocols (Not Compliant - N).
     """
     # Standardize hostname
-    host = target_url.replace("https://", "").replace("http://", "").split('/')[0]
+    host = host_of(target_url)
     port = 443
     
-    # Map of weak protocols to test
-    weak_protocols = {
-        "SSLv2": ssl.PROTOCOL_SSLv23, # Historically used to probe older versions
-        "SSLv3": ssl.PROTOCOL_SSLv3 if hasattr(ssl, 'PROTOCOL_SSLv3') else None,
-        "TLSv1": ssl.PROTOCOL_TLSv1,
-        "TLSv1.1": ssl.PROTOCOL_TLSv1_1
-    }
-    
-    found_weak = []
-
-    for name, proto in weak_protocols.items():
-        if proto is None: continue # Skip if Python build doesn't even support the old protocol
-        
-        try:
-            context = ssl.SSLContext(proto)
-            with socket.create_connection((host, port), timeout=5) as sock:
-                with context.wrap_socket(sock, server_hostname=host) as ssock:
-                    # If we get here, the connection was successful using a weak protocol
-                    found_weak.append(name)
-        except (ssl.SSLError, socket.timeout, ConnectionRefusedError, OSError):
-            # This is GOOD. It means the server rejected the weak protocol.
-            continue
+    # Each handshake is an independent connection, so try them all at once
+    with ThreadPoolExecutor(max_workers=max(1, len(_CONTEXTS))) as executor:
+        found_weak = [name for name in executor.map(lambda name: _probe(name, host, port), _CONTEXTS) if name]
 
     # --- Compliance Logic ---
 
@@ -1,5 +1,50 @@
 import ssl
 import socket
+from concurrent.futures import ThreadPoolExecutor
+
+from ._dns import connect
+from ._url import host_of
+
+# List of OpenSSL cipher strings that are considered weak/insecure
+# NULL: No encryption, EXPORT: Old 40/56-bit encryption, DES/RC4: Broken
+WEAK_CIPHER_GROUPS = [
+    "NULL", "EXPORT", "DES", "RC4", "3DES", "MD5"
+]
+
+def _build_context(cipher):
+    # Create a context that specifically tries to use the weak cipher
+    context = ssl.create_default_context()
+    try:
+        context.set_ciphers(cipher)
+    except ssl.SSLError:
+        return None
+    return context
+
+# set_ciphers mutates the context, so each group gets its own; built once at import.
+# Groups the local OpenSSL can't even offer could never be negotiated, so they
+# are dropped here instead of failing a socket round-trip on every scan.
+_CONTEXTS = {
+    cipher: context
+    for cipher, context in ((c, _build_context(c)) for c in WEAK_CIPHER_GROUPS)
+    if context is not None
+}
+_PROBE_CIPHERS = list(_CONTEXTS)
+
+# Rejection is the expected outcome; all of these are OSError subclasses
+_HANDSHAKE_ERRORS = (ssl.SSLError, socket.timeout, ConnectionRefusedError, OSError)
+
+def _probe(cipher, host, port):
+    """Return a description of the negotiated cipher if `cipher` is accepted, else None."""
+    context = _CONTEXTS[cipher]
+    try:
+        with connect(host, port) as sock:
+            with context.wrap_socket(sock, server_hostname=host) as ssock:
+                # If connection succeeds, the server supports this weak cipher
+                actual_cipher = ssock.cipher()
+                return f"{cipher} ({actual_cipher[0]})"
+    except _HANDSHAKE_ERRORS:
+        # This is GOOD - server rejected the weak cipher
+        return None
 
 def run_check(target_url):
     """
@@ -8,31 +53,12 @@ def run_check(target_url):
     - Success: Connection refused for weak ciphers (Compliant - Y).
     - Failure: Weak ciphers are accepted (Not Compliant - N).
     """
-    host = target_url.replace("https://", "").replace("http://", "").split('/')[0]
+    host = host_of(target_url)
     port = 443
     
-    # List of OpenSSL cipher strings that are considered weak/insecure
-    # NULL: No encryption, EXPORT: Old 40/56-bit encryption, DES/RC4: Broken
-    weak_cipher_groups = [
-        "NULL", "EXPORT", "DES", "RC4", "3DES", "MD5"
-    ]
-    
-    found_weak = []
-
-    for cipher in weak_cipher_groups:
-        try:
-            # Create a context that specifically tries to use the weak cipher
-            context = ssl.create_default_context()
-            context.set_ciphers(cipher)
-            
-            with socket.create_connection((host, port), timeout=5) as sock:
-                with context.wrap_socket(sock, server_hostname=host) as ssock:
-                    # If connection succeeds, the server supports this weak cipher
-                    actual_cipher = ssock.cipher()
-                    found_weak.append(f"{cipher} ({actual_cipher[0]})")
-        except (ssl.SSLError, socket.timeout, ConnectionRefusedError, OSError):
-            # This is GOOD - server rejected the weak cipher
-            continue
+    # Each cipher group is an independent handshake, so try them all at once
+    with ThreadPoolExecutor(max_workers=max(1, len(_PROBE_CIPHERS))) as executor:
+        found_weak = [hit for hit in executor.map(lambda c: _probe(c, host, port), _PROBE_CIPHERS) if hit]
 
     # --- Compliance Logic ---
 
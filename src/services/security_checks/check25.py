@@ -1,6 +1,55 @@
 import ssl
 import socket
 
+from ._dns import connect
+from ._url import host_of
+
+def _build_sslv2_context():
+    """SSLv2-only client context, or None if the local OpenSSL can't build one."""
+    # Without PROTOCOL_SSLv2 a fallback context would just negotiate modern TLS
+    # and report that as SSLv2 support, so there is nothing meaningful to probe.
+    if not hasattr(ssl, 'PROTOCOL_SSLv2'):
+        return None
+    try:
+        context = ssl.SSLContext(ssl.PROTOCOL_SSLv2)
+        if hasattr(ssl, 'OP_NO_SSLv3'): context.options |= ssl.OP_NO_SSLv3
+        if hasattr(ssl, 'OP_NO_TLSv1'): context.options |= ssl.OP_NO_TLSv1
+        return context
+    except Exception:
+        return None
+
+# Built once at import. None (the norm: SSLv2 was dropped from OpenSSL 1.1.0)
+# means run_check answers without touching the network.
+_SSLV2_CONTEXT = _build_sslv2_context()
+
+_UNSUPPORTED_LOCALLY = {
+    "check_name": "DROWN Attack Protection",
+    "compliance": "Y",
+    "remark": "Compliant: SSLv2 is unsupported by the environment and server. DROWN risk mitigated. Y",
+    "severity": "info"
+}
+
+_NOT_COMPLIANT = {
+    "check_name": "DROWN Attack Protection",
+    "compliance": "N",
+    "remark": "NOT COMPLIANT: Server supports SSLv2. Vulnerable to DROWN attack which can decrypt TLS sessions. N",
+    "severity": "high" # Red
+}
+
+_COMPLIANT = {
+    "check_name": "DROWN Attack Protection",
+    "compliance": "Y",
+    "remark": "Compliant: SSLv2 is disabled. Server is protected against DROWN vulnerability. Y",
+    "severity": "info" # Green
+}
+
+_MODERN_TLS = {
+    "check_name": "DROWN Attack Protection",
+    "compliance": "Y",
+    "remark": "Compliant: Server enforces modern TLS; legacy SSLv2 is inaccessible. Y",
+    "severity": "info"
+}
+
 def run_check(target_url):
     """
     Compliance Check: DROWN Attack Protection (SSLv2)
@@ -8,53 +57,28 @@ def run_check(target_url):
     - Success: SSLv2 is completely disabled (Compliant - Y).
     - Failure: Server responds to SSLv2 handshakes (Not Compliant - N).
     """
-    host = target_url.replace("https://", "").replace("http://", "").split('/')[0]
+    host = host_of(target_url)
     port = 443
 
     try:
         # Create an SSL context specifically for SSLv2
         # Note: Most modern Python/OpenSSL builds have removed SSLv2 support entirely.
         # If the library doesn't support it, the server is inherently protected from local probing.
-        try:
-            # We use a legacy protocol constant if available
-            context = ssl.SSLContext(ssl.PROTOCOL_SSLv2 if hasattr(ssl, 'PROTOCOL_SSLv2') else ssl.PROTOCOL_SSLv23)
-            if hasattr(ssl, 'OP_NO_SSLv3'): context.options |= ssl.OP_NO_SSLv3
-            if hasattr(ssl, 'OP_NO_TLSv1'): context.options |= ssl.OP_NO_TLSv1
-        except Exception:
+        if _SSLV2_CONTEXT is None:
             # If we can't even create an SSLv2 context, it's a good sign for compliance
-            return {
-                "check_name": "DROWN Attack Protection",
-                "compliance": "Y",
-                "remark": "Compliant: SSLv2 is unsupported by the environment and server. DROWN risk mitigated. Y",
-                "severity": "info"
-            }
+            return _UNSUPPORTED_LOCALLY
 
         try:
-            with socket.create_connection((host, port), timeout=5) as sock:
-                with context.wrap_socket(sock, server_hostname=host) as ssock:
+            with connect(host, port) as sock:
+                with _SSLV2_CONTEXT.wrap_socket(sock, server_hostname=host) as ssock:
                     # If we successfully connect with SSLv2 settings
-                    return {
-                        "check_name": "DROWN Attack Protection",
-                        "compliance": "N",
-                        "remark": "NOT COMPLIANT: Server supports SSLv2. Vulnerable to DROWN attack which can decrypt TLS sessions. N",
-                        "severity": "high" # Red
-                    }
+                    return _NOT_COMPLIANT
         except (ssl.SSLError, socket.timeout, ConnectionRefusedError, OSError):
             # Connection failed - SSLv2 is disabled
             pass
 
         # 1. SUCCESS: Server rejected the SSLv2 handshake
-        return {
-            "check_name": "DROWN Attack Protection",
-            "compliance": "Y",
-            "remark": "Compliant: SSLv2 is disabled. Server is protected against DROWN vulnerability. Y",
-            "severity": "info" # Green
-        }
+        return _COMPLIANT
 
     except Exception as e:
-        return {
-            "check_name": "DROWN Attack Protection",
-            "compliance": "Y",
-            "remark": "Compliant: Server enforces modern TLS; legacy SSLv2 is inaccessible. Y",
-            "severity": "info"
-        }
\ No newline at end of file
+        return _MODERN_TLS
\ No newline at end of file
@@ -1,4 +1,40 @@
-import socket
+import ssl
+
+from ._dns import connect
+from ._url import parse_target
+
+# Only the status line matters; cap it so a misbehaving server can't stream forever
+MAX_STATUS_LINE = 1024
+
+_CONTEXT = ssl.create_default_context()
+
+_COMPLIANT = {
+    "check_name": "Legacy HTTP/1.0 Support",
+    "compliance": "Y",
+    "remark": "Compliant: Server restricts or upgrades legacy HTTP/1.0 requests to HTTP/1.1+. Y",
+    "severity": "info" # Green
+}
+
+_NOT_COMPLIANT = {
+    "check_name": "Legacy HTTP/1.0 Support",
+    "compliance": "N",
+    "remark": "NOT COMPLIANT: Server fully supports obsolete HTTP/1.0. Risk of request smuggling and proxy bypass. N",
+    "severity": "high" # Red
+}
+
+_NO_HTTP10_RESPONSE = {
+    "check_name": "Legacy HTTP/1.0 Support",
+    "compliance": "Y",
+    "remark": "Compliant: Server does not provide a standard HTTP/1.0 response. Y",
+    "severity": "info"
+}
+
+_REFUSED = {
+    "check_name": "Legacy HTTP/1.0 Support",
+    "compliance": "Y",
+    "remark": "Compliant: Server refused the legacy connection attempt. Y",
+    "severity": "info"
+}
 
 def run_check(target_url):
     """
@@ -6,59 +42,39 @@ def run_check(target_url):
     - Success: Server rejects or upgrades HTTP/1.0 requests (Compliant - Y).
     - Failure: Server responds fully to HTTP/1.0 (Not Compliant - N).
     """
-    host = target_url.replace("https://", "").replace("http://", "").split('/')[0]
-    port = 443 if target_url.startswith("https") else 80
+    host, port, scheme = parse_target(target_url)
     
     # Raw HTTP/1.0 request string
     # HTTP/1.0 does not require a 'Host' header, which is a security weakness
-    request = f"GET / HTTP/1.0\r\n\r\n"
+    # Connection: close so the server hangs up right after answering
+    request = b"GET / HTTP/1.0\r\nConnection: close\r\n\r\n"
 
     try:
         # We use a raw socket to ensure we are sending exactly HTTP/1.0 
         # (The requests library often auto-upgrades to 1.1)
-        with socket.create_connection((host, port), timeout=5) as sock:
-            if port == 443:
-                import ssl
-                context = ssl.create_default_context()
-                sock = context.wrap_socket(sock, server_hostname=host)
+        with connect(host, port) as sock:
+            if scheme == "https":
+                sock = _CONTEXT.wrap_socket(sock, server_hostname=host)
             
-            sock.sendall(request.encode())
-            response = sock.recv(1024).decode(errors='ignore')
+            sock.sendall(request)
+            # Read just the status line (up to the first CRLF); the body is never drained
+            with sock.makefile('rb', buffering=0) as reader:
+                status_line = reader.readline(MAX_STATUS_LINE)
 
             # --- Compliance Logic ---
 
             # 1. SUCCESS: Server returns 426 (Upgrade Required), 400 (Bad Request), 
             # or specifically labels the response as HTTP/1.1 even though we asked for 1.0.
-            if "HTTP/1.1" in response or "426 Upgrade Required" in response or "400 Bad Request" in response:
-                return {
-                    "check_name": "Legacy HTTP/1.0 Support",
-                    "compliance": "Y",
-                    "remark": "Compliant: Server restricts or upgrades legacy HTTP/1.0 requests to HTTP/1.1+. Y",
-                    "severity": "info" # Green
-                }
+            if status_line.startswith(b"HTTP/1.1") or b" 426" in status_line or b" 400" in status_line:
+                return _COMPLIANT
 
             # 2. FAILURE: Server responds with 200 OK using the legacy HTTP/1.0 protocol
-            elif "HTTP/1.0 200 OK" in response:
-                return {
-                    "check_name": "Legacy HTTP/1.0 Support",
-                    "compliance": "N",
-                    "remark": "NOT COMPLIANT: Server fully supports obsolete HTTP/1.0. Risk of request smuggling and proxy bypass. N",
-                    "severity": "high" # Red
-                }
+            elif status_line.startswith(b"HTTP/1.0 200"):
+                return _NOT_COMPLIANT
 
             # 3. SUCCESS: Any other error or connection drop
             else:
-                return {
-                    "check_name": "Legacy HTTP/1.0 Support",
-                    "compliance": "Y",
-                    "remark": "Compliant: Server does not provide a standard HTTP/1.0 response. Y",
-                    "severity": "info"
-                }
+                return _NO_HTTP10_RESPONSE
 
     except Exception as e:
-        return {
-            "check_name": "Legacy HTTP/1.0 Support",
-            "compliance": "Y",
-            "remark": f"Compliant: Server refused the legacy connection attempt. Y",
-            "severity": "info"
-        }
\ No newline at end of file
+        return _REFUSED
\ No newline at end of file
@@ -1,5 +1,112 @@
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import dns.exception
 import dns.resolver
-from typing import Dict, Any
+from typing import Any, Dict, Optional, Tuple
+
+from src.core.settings import get_settings
+
+from ._url import host_of
+
+CAA_TTL_SECONDS = 300
+CAA_CACHE_MAXSIZE = 1024
+
+# Nameservers come from settings.CAA_NAMESERVERS; by default only the system
+# resolver is asked, so internal names stay on the local (split-horizon) DNS.
+# With several configured, the first answer with records wins and "no CAA"
+# is believed once CAA_QUORUM of the resolvers that answered agree.
+CAA_QUORUM = 2
+
+# dnspython's TTL-aware cache, shared by every resolver for repeat scans
+_DNS_CACHE = dns.resolver.LRUCache(1024)
+
+def _make_resolver(nameserver: Optional[str] = None) -> dns.resolver.Resolver:
+    # Short timeouts so a slow nameserver can't stall the scan (the default
+    # lifetime is several seconds per query)
+    resolver = dns.resolver.Resolver(configure=nameserver is None)
+    if nameserver is not None:
+        resolver.nameservers = [nameserver]
+    resolver.timeout = 2
+    resolver.lifetime = 3
+    resolver.cache = _DNS_CACHE
+    return resolver
+
+# Built once for the process; building one per call rereads /etc/resolv.conf.
+_RESOLVERS = [
+    _make_resolver(ns.strip()) for ns in get_settings().CAA_NAMESERVERS.split(",") if ns.strip()
+] or [_make_resolver()]
+_POOL = ThreadPoolExecutor(max_workers=4 * len(_RESOLVERS), thread_name_prefix="caa")
+
+_caa_cache: "OrderedDict[str, Tuple[float, Optional[Tuple[str, ...]]]]" = OrderedDict()
+_caa_lock = threading.Lock()
+
+def _query(resolver: dns.resolver.Resolver, domain: str) -> Optional[Tuple[str, ...]]:
+    try:
+        # CAA format: <flags> <tag> <value> (e.g., 0 issue "letsencrypt.org")
+        return tuple(str(rdata) for rdata in resolver.resolve(domain, 'CAA'))
+    except (dns.resolver.NoAnswer, dns.resolver.NXDOMAIN):
+        return None
+
+def _query_quorum(domain: str) -> Optional[Tuple[str, ...]]:
+    """
+    Ask every resolver at once and return as soon as the outcome is settled,
+    so one slow or dead resolver no longer costs the whole query lifetime.
+
+    A resolver that times out or fails (SERVFAIL/REFUSED, i.e. NoNameservers)
+    abstains: it neither counts towards nor against the quorum. The lookup
+    only fails when nobody gave an answer.
+    """
+    futures = [_POOL.submit(_query, resolver, domain) for resolver in _RESOLVERS]
+    quorum = min(CAA_QUORUM, len(futures))
+    negatives = 0
+    error: Optional[Exception] = None
+    abstained: Optional[Exception] = None
+    for future in as_completed(futures):
+        try:
+            records = future.result()
+        except (dns.exception.Timeout, dns.resolver.NoNameservers) as e:
+            abstained = e
+            continue
+        except Exception as e:
+            error = e
+            continue
+        if records is not None:
+            return records
+        negatives += 1
+        if negatives >= quorum:
+            return None
+
+    # Every resolver that answered said "no CAA"; the rest abstained
+    if negatives and error is None:
+        return None
+    raise error or abstained
+
+def _lookup_caa(domain: str) -> Optional[Tuple[str, ...]]:
+    """
+    CAA records for `domain` as strings, or None when the name has none
+    (NoAnswer / NXDOMAIN). Both outcomes are cached for a short TTL; DNS
+    errors, NoNameservers included, propagate and are retried next time.
+    """
+    now = time.monotonic()
+    with _caa_lock:
+        entry = _caa_cache.get(domain)
+        if entry is not None:
+            if entry[0] > now:
+                _caa_cache.move_to_end(domain)
+                return entry[1]
+            del _caa_cache[domain]
+
+    records = _query_quorum(domain)
+
+    with _caa_lock:
+        _caa_cache[domain] = (now + CAA_TTL_SECONDS, records)
+        _caa_cache.move_to_end(domain)
+        while len(_caa_cache) > CAA_CACHE_MAXSIZE:
+            _caa_cache.popitem(last=False)
+    return records
 
 def run_check(target_url: str) -> Dict[str, Any]:
     """
@@ -10,16 +117,15 @@ def run_check(target_url: str) -> Dict[str, Any]:
     """
     check_name = "DNS CAA Record Status"
     # Extract domain from URL (e.g., https://example.com/page -> example.com)
-    domain = target_url.replace("https://", "").replace("http://", "").split('/')[0]
+    domain = host_of(target_url)
     
     try:
-        # Query for CAA records
-        answers = dns.resolver.resolve(domain, 'CAA')
-        
-        caa_records = []
-        for rdata in answers:
-            # CAA format: <flags> <tag> <value> (e.g., 0 issue "letsencrypt.org")
-            caa_records.append(str(rdata))
+        # Query for CAA records (cached per domain)
+        answers = _lookup_caa(domain)
+        if answers is None:
+            raise dns.resolver.NoAnswer
+
+        caa_records = list(answers)
 
         # --- Compliance Logic: SUCCESS ---
         if caa_records:
@@ -1,31 +1,51 @@
 import requests
 
-def run_check(target_url):
+from . import SESSION
+from ._cache import cached_get
+from ._url import origin_of
+
+_OPERATIONAL = {
+    "check_name": "HTTPS Operationality",
+    "compliance": "Y",
+    "remark": "Compliant: Website is fully operational over HTTPS (Status 200). Secure connection established.",
+    "severity": "info" # Green
+}
+
+_DOWNGRADED_TO_HTTP = {
+    "check_name": "HTTPS Operationality",
+    "compliance": "N",
+    "remark": "NOT COMPLIANT: The final destination after processing is not secure (HTTP).",
+    "severity": "high" # Red
+}
+
+_CERT_INVALID = {
+    "check_name": "HTTPS Operationality",
+    "compliance": "N",
+    "remark": "NOT COMPLIANT: SSL/TLS Certificate validation failed. The site may be using an expired or self-signed certificate.",
+    "severity": "high" # Red
+}
+
+def run_check(target_url=None, session=None, response=None):
     """
     Compliance Check: HTTPS Operational State
     - Verifies the site is fully operational over HTTPS.
     - Success: Status 200 OK via HTTPS (Compliant - Y)
     - Failure: SSL Errors, Connection Failures, or Certificate issues (Not Compliant - N)
     """
-    # Ensure we are testing the HTTPS version
-    clean_host = target_url.replace("https://", "").replace("http://", "").split('/')[0]
-    https_url = f"https://{clean_host}"
-    
     try:
-        # We allow redirects here because we want to see the final destination
-        # verify=True ensures we check the SSL certificate validity
-        response = requests.get(https_url, timeout=10, allow_redirects=True)
+        # Callers may pass the pre-fetched HTTPS response shared with check9
+        if response is None:
+            # Ensure we are testing the HTTPS version
+            https_url = origin_of(target_url, "https")
+            # GET follows redirects, so we see the final destination
+            # verify=True ensures we check the SSL certificate validity
+            response = cached_get(https_url, session=session or SESSION, headers_only=True)
         
         # --- Compliance Logic ---
 
         # 1. Success Case: Operational 200 OK over HTTPS
         if response.status_code == 200 and response.url.startswith("https://"):
-            return {
-                "check_name": "HTTPS Operationality",
-                "compliance": "Y",
-                "remark": "Compliant: Website is fully operational over HTTPS (Status 200). Secure connection established.",
-                "severity": "info" # Green
-            }
+            return _OPERATIONAL
         
         # 2. Warning Case: Accessible but weird status (e.g., 403 Forbidden or 401 Unauthorized)
         elif response.url.startswith("https://"):
@@ -38,20 +58,10 @@ def run_check(target_url):
 
         # 3. Failure Case: Somehow landed back on HTTP
         else:
-            return {
-                "check_name": "HTTPS Operationality",
-                "compliance": "N",
-                "remark": "NOT COMPLIANT: The final destination after processing is not secure (HTTP).",
-                "severity": "high" # Red
-            }
+            return _DOWNGRADED_TO_HTTP
 
     except requests.exceptions.SSLError:
-        return {
-            "check_name": "HTTPS Operationality",
-            "compliance": "N",
-            "remark": "NOT COMPLIANT: SSL/TLS Certificate validation failed. The site may be using an expired or self-signed certificate.",
-            "severity": "high" # Red
-        }
+        return _CERT_INVALID
     except requests.exceptions.RequestException as e:
         return {
             "check_name": "HTTPS Operationality",
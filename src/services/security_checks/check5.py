@@ -1,7 +1,19 @@
 import requests
 import re
 
-def run_check(target_url):
+from ._cache import header_response
+
+# Regex to detect version numbers (e.g., 7.4.3, 5.0)
+_VERSION_RE = re.compile(r'\d+\.\d+')
+
+_NO_LEAKS = {
+    "check_name": "Software Version Disclosure",
+    "compliance": "Y",
+    "remark": "Compliant: No software or CMS version information detected in HTTP headers.",
+    "severity": "info" # Green
+}
+
+def run_check(target_url=None, session=None, response=None):
     """
     Compliance Check: Software Fingerprinting Disclosure
     - Inspects headers like X-Powered-By, X-Generator, and X-AspNet-Version.
@@ -16,19 +28,17 @@ def run_check(target_url):
         "X-AspNetMvc-Version",
         "X-Powered-CMS"
     ]
-    
-    # Regex to detect version numbers (e.g., 7.4.3, 5.0)
-    version_pattern = r'\d+\.\d+'
 
     try:
-        response = requests.get(target_url, timeout=10)
+        response = header_response(target_url, session, response)
         found_leaks = []
 
         for header in leak_headers:
             value = response.headers.get(header)
             if value:
-                # Check if the value contains a version number
-                if re.search(version_pattern, value):
+                # Check if the value contains a version number; a version needs a '.',
+                # so the substring test screens most values out before the regex
+                if '.' in value and _VERSION_RE.search(value):
                     found_leaks.append(f"{header}: {value}")
                 # Even if no version, X-Powered-By is better removed entirely
                 elif header == "X-Powered-By":
@@ -38,12 +48,7 @@ def run_check(target_url):
 
         # 1. SUCCESS: No leaking headers found
         if not found_leaks:
-            return {
-                "check_name": "Software Version Disclosure",
-                "compliance": "Y",
-                "remark": "Compliant: No software or CMS version information detected in HTTP headers.",
-                "severity": "info" # Green
-            }
+            return _NO_LEAKS
 
         # 2. FAILURE: One or more headers are leaking info
         else:
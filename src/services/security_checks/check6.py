@@ -1,7 +1,27 @@
 import requests
 import re
 
-def run_check(target_url):
+from ._cache import header_response
+
+# Apache Inode-style ETags often look like: "inode-size-timestamp"
+# Example: "680c1-45-42a7c8D8"
+_INODE_RE = re.compile(r'^[a-fA-F0-9]+-[a-fA-F0-9]+-[a-fA-F0-9]+$')
+
+_ETAG_DISABLED = {
+    "check_name": "E-Tag Info Leakage",
+    "compliance": "Y",
+    "remark": "Compliant: E-Tag header is disabled. No filesystem or version info leaked.",
+    "severity": "info" # Green
+}
+
+_ETAG_HASHED = {
+    "check_name": "E-Tag Info Leakage",
+    "compliance": "Y",
+    "remark": "Compliant: E-Tag is present but uses a secure hash format without leaking Inode data.",
+    "severity": "info" # Green
+}
+
+def run_check(target_url=None, session=None, response=None):
     """
     Compliance Check: E-Tag Information Leakage
     - Inspects the 'ETag' header for potential Inode leakage.
@@ -9,29 +29,20 @@ def run_check(target_url):
     - Failure: Header reveals filesystem Inodes (Not Compliant - N).
     """
     try:
-        response = requests.get(target_url, timeout=10)
+        response = header_response(target_url, session, response)
         etag = response.headers.get('ETag', '')
 
         # --- Compliance Logic ---
 
         # 1. SUCCESS: Header is not present (Standard recommendation for high security)
         if not etag:
-            return {
-                "check_name": "E-Tag Info Leakage",
-                "compliance": "Y",
-                "remark": "Compliant: E-Tag header is disabled. No filesystem or version info leaked.",
-                "severity": "info" # Green
-            }
+            return _ETAG_DISABLED
 
         # 2. FAILURE: Detects the 'Inode' pattern (typically 3 parts separated by dashes/quotes)
-        # Apache Inode-style ETags often look like: "inode-size-timestamp"
-        # Example: "680c1-45-42a7c8D8"
-        inode_pattern = r'^[a-fA-F0-9]+-[a-fA-F0-9]+-[a-fA-F0-9]+$'
-        
         # Clean the E-Tag for testing (remove quotes and 'W/' prefix for weak ETags)
         clean_etag = etag.replace('W/', '').replace('"', '')
 
-        if re.match(inode_pattern, clean_etag):
+        if _INODE_RE.match(clean_etag):
             return {
                 "check_name": "E-Tag Info Leakage",
                 "compliance": "N",
@@ -41,12 +52,7 @@ def run_check(target_url):
 
         # 3. SUCCESS: E-Tag is present but appears to be a secure hash (like a single long string)
         else:
-            return {
-                "check_name": "E-Tag Info Leakage",
-                "compliance": "Y",
-                "remark": "Compliant: E-Tag is present but uses a secure hash format without leaking Inode data.",
-                "severity": "info" # Green
-            }
+            return _ETAG_HASHED
 
     except requests.exceptions.RequestException as e:
         return {
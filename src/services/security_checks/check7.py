@@ -1,6 +1,29 @@
 import requests
 
-def run_check(target_url):
+from ._cache import header_response
+
+_BLOCK_MODE = {
+    "check_name": "X-XSS-Protection",
+    "compliance": "Y",
+    "remark": "Compliant: Header is enabled in 'block' mode (1; mode=block).",
+    "severity": "info" # Green
+}
+
+_DISABLED = {
+    "check_name": "X-XSS-Protection",
+    "compliance": "N",
+    "remark": "NOT COMPLIANT: XSS filter is explicitly disabled (X-XSS-Protection: 0).",
+    "severity": "high" # Red
+}
+
+_MISSING = {
+    "check_name": "X-XSS-Protection",
+    "compliance": "N",
+    "remark": "NOT COMPLIANT: X-XSS-Protection header is missing. Legacy browsers remain vulnerable to reflected XSS.",
+    "severity": "high" # Red
+}
+
+def run_check(target_url=None, session=None, response=None):
     """
     Compliance Check: X-XSS-Protection Header
     - Success: Header set to '1; mode=block' (Compliant - Y)
@@ -8,19 +31,14 @@ def run_check(target_url):
     - Failure: Header is missing (Not Compliant - N)
     """
     try:
-        response = requests.get(target_url, timeout=10)
+        response = header_response(target_url, session, response)
         xss_header = response.headers.get('X-XSS-Protection', '').lower()
 
         # --- Compliance Logic ---
 
         # 1. SUCCESS: The gold standard for this header
         if xss_header == "1; mode=block":
-            return {
-                "check_name": "X-XSS-Protection",
-                "compliance": "Y",
-                "remark": "Compliant: Header is enabled in 'block' mode (1; mode=block).",
-                "severity": "info" # Green
-            }
+            return _BLOCK_MODE
 
         # 2. WARNING: Enabled but not in block mode
         elif "1" in xss_header:
@@ -33,21 +51,11 @@ def run_check(target_url):
 
         # 3. FAILURE: Header is disabled (0)
         elif xss_header == "0":
-            return {
-                "check_name": "X-XSS-Protection",
-                "compliance": "N",
-                "remark": "NOT COMPLIANT: XSS filter is explicitly disabled (X-XSS-Protection: 0).",
-                "severity": "high" # Red
-            }
+            return _DISABLED
 
         # 4. FAILURE: Header is missing
         else:
-            return {
-                "check_name": "X-XSS-Protection",
-                "compliance": "N",
-                "remark": "NOT COMPLIANT: X-XSS-Protection header is missing. Legacy browsers remain vulnerable to reflected XSS.",
-                "severity": "high" # Red
-            }
+            return _MISSING
 
     except requests.exceptions.RequestException as e:
         return {
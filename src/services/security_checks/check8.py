@@ -1,13 +1,43 @@
 import requests
 
-def run_check(target_url):
+from ._cache import header_response
+
+_DENY = {
+    "check_name": "X-Frame-Options",
+    "compliance": "Y",
+    "remark": "Compliant: Clickjacking protection is fully enabled (X-Frame-Options: DENY).",
+    "severity": "info" # Green
+}
+
+_SAMEORIGIN = {
+    "check_name": "X-Frame-Options",
+    "compliance": "Y",
+    "remark": "Compliant: Framing is restricted to the same origin (X-Frame-Options: SAMEORIGIN).",
+    "severity": "info" # Green
+}
+
+_ALLOW_FROM = {
+    "check_name": "X-Frame-Options",
+    "compliance": "N",
+    "remark": "NOT COMPLIANT: Uses deprecated 'ALLOW-FROM' directive. This is not supported by modern browsers.",
+    "severity": "high" # Red
+}
+
+_MISSING = {
+    "check_name": "X-Frame-Options",
+    "compliance": "N",
+    "remark": "NOT COMPLIANT: X-Frame-Options header is missing. The site is vulnerable to Clickjacking attacks.",
+    "severity": "high" # Red
+}
+
+def run_check(target_url=None, session=None, response=None):
     """
     Compliance Check: X-Frame-Options (Clickjacking Protection)
     - Success: Header set to 'DENY' or 'SAMEORIGIN' (Compliant - Y)
     - Failure: Header is missing or set incorrectly (Not Compliant - N)
     """
     try:
-        response = requests.get(target_url, timeout=10)
+        response = header_response(target_url, session, response)
         # Headers are case-insensitive, but we normalize to uppercase for comparison
         xfo_header = response.headers.get('X-Frame-Options', '').upper()
 
@@ -15,39 +45,19 @@ def run_check(target_url):
 
         # 1. SUCCESS: The most restrictive and secure setting
         if xfo_header == "DENY":
-            return {
-                "check_name": "X-Frame-Options",
-                "compliance": "Y",
-                "remark": "Compliant: Clickjacking protection is fully enabled (X-Frame-Options: DENY).",
-                "severity": "info" # Green
-            }
+            return _DENY
 
         # 2. SUCCESS: Safe for internal framing
         elif xfo_header == "SAMEORIGIN":
-            return {
-                "check_name": "X-Frame-Options",
-                "compliance": "Y",
-                "remark": "Compliant: Framing is restricted to the same origin (X-Frame-Options: SAMEORIGIN).",
-                "severity": "info" # Green
-            }
+            return _SAMEORIGIN
 
         # 3. FAILURE: Explicitly insecure or deprecated value
         elif "ALLOW-FROM" in xfo_header:
-            return {
-                "check_name": "X-Frame-Options",
-                "compliance": "N",
-                "remark": f"NOT COMPLIANT: Uses deprecated 'ALLOW-FROM' directive. This is not supported by modern browsers.",
-                "severity": "high" # Red
-            }
+            return _ALLOW_FROM
 
         # 4. FAILURE: Header is completely missing
         else:
-            return {
-                "check_name": "X-Frame-Options",
-                "compliance": "N",
-                "remark": "NOT COMPLIANT: X-Frame-Options header is missing. The site is vulnerable to Clickjacking attacks.",
-                "severity": "high" # Red
-            }
+            return _MISSING
 
     except requests.exceptions.RequestException as e:
         return {
@@ -1,6 +1,22 @@
-import requests
+from . import SESSION
+from ._cache import cached_get
+from ._url import origin_of
 
-def run_check(target_url):
+_MISSING = {
+    "check_name": "HSTS Enabled",
+    "compliance": "N",
+    "remark": "NOT COMPLIANT: HSTS header is missing. Site is vulnerable to SSL stripping attacks.",
+    "severity": "high" # Red
+}
+
+_DISABLED = {
+    "check_name": "HSTS Enabled",
+    "compliance": "N",
+    "remark": "NOT COMPLIANT: HSTS is explicitly disabled (max-age=0).",
+    "severity": "high" # Red
+}
+
+def run_check(target_url=None, session=None, response=None):
     """
     Compliance Check: HSTS (HTTP Strict-Transport-Security)
     - Success: Header present with max-age >= 15768000 (6 months) (Compliant - Y)
@@ -8,29 +24,30 @@ def run_check(target_url):
     - Failure: Header missing or set to 0 (Not Compliant - N)
     """
     try:
-        # HSTS only works over HTTPS, so we force an HTTPS check
-        clean_host = target_url.replace("https://", "").replace("http://", "").split('/')[0]
-        https_url = f"https://{clean_host}"
-        
-        response = requests.get(https_url, timeout=10)
+        # Callers may pass the pre-fetched HTTPS response shared with check3
+        if response is None:
+            # HSTS only works over HTTPS, so we force an HTTPS check
+            https_url = origin_of(target_url, "https")
+            response = cached_get(https_url, session=session or SESSION, headers_only=True)
         hsts = response.headers.get('Strict-Transport-Security', '')
 
         # --- Compliance Logic ---
 
         # 1. FAILURE: Header is completely missing
         if not hsts:
-            return {
-                "check_name": "HSTS Enabled",
-                "compliance": "N",
-                "remark": "NOT COMPLIANT: HSTS header is missing. Site is vulnerable to SSL stripping attacks.",
-                "severity": "high" # Red
-            }
+            return _MISSING
 
-        # Parse directives
-        directives = {d.strip().split('=')[0].lower(): d.strip().split('=')[1] if '=' in d else True 
-                      for d in hsts.split(';')}
-        
-        max_age = int(directives.get('max-age', 0))
+        # Parse directives in one pass; valueless ones (includeSubDomains) map to ''
+        directives = {}
+        for d in hsts.split(';'):
+            key, _, value = d.partition('=')
+            key = key.strip().lower()
+            if key:
+                directives[key] = value.strip().strip('"')
+
+        # A malformed max-age counts as 0 rather than raising
+        max_age_raw = directives.get('max-age', '')
+        max_age = int(max_age_raw) if max_age_raw.isdigit() else 0
         has_subdomains = 'includesubdomains' in directives
 
         # 2. SUCCESS: The "Gold Standard" (>= 1 year, includes subdomains)
@@ -59,12 +76,7 @@ def run_check(target_url):
 
         # 4. FAILURE: max-age=0 (Explicitly disabled)
         else:
-            return {
-                "check_name": "HSTS Enabled",
-                "compliance": "N",
-                "remark": "NOT COMPLIANT: HSTS is explicitly disabled (max-age=0).",
-                "severity": "high" # Red
-            }
+            return _DISABLED
 
     except Exception as e:
         return {
@@ -0,0 +1,120 @@
+# src/app/services/security_checks/cipher_probe.py
+
+from __future__ import annotations
+
+import socket
+import ssl
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional, Tuple
+
+from ._dns import connect
+
+PROBE_TTL_SECONDS = 30
+PROBE_CACHE_MAXSIZE = 256
+
+# Weak cipher families probed for Logjam (19), anonymous suites (23) and FREAK (24)
+CIPHER_FAMILIES = {
+    # 'EXP' refers to Export-grade ciphers used in Logjam; 'EDH' is Ephemeral Diffie-Hellman
+    "export_dh": "EXP-EDH-RSA-DES-CBC-SHA:EXP-EDH-RSA-DES-CBC",
+    # 'aNULL' is the OpenSSL string for ciphers that provide no authentication
+    "anull": "aNULL",
+    # OpenSSL cipher string for Export-grade RSA
+    "export": "EXPORT",
+}
+
+_HANDSHAKE_ERRORS = (ssl.SSLError, socket.timeout, ConnectionRefusedError, OSError)
+
+
+def _build_context(family: str) -> Optional[ssl.SSLContext]:
+    """Context offering only `family`'s suites, or None if OpenSSL can't compile them."""
+    # Anonymous suites carry no certificate to verify, so that context starts unverified
+    if family == "anull":
+        context = ssl._create_unverified_context()
+    else:
+        context = ssl.create_default_context()
+    try:
+        context.set_ciphers(CIPHER_FAMILIES[family])
+    except ssl.SSLError:
+        return None
+    return context
+
+
+# Built once at import. A family missing here can't be offered by this OpenSSL
+# build (EXPORT and export DH are gone from every 1.1.0+ build), so the check
+# that owns it answers without touching the network.
+CONTEXTS: Dict[str, ssl.SSLContext] = {
+    family: context
+    for family, context in ((f, _build_context(f)) for f in CIPHER_FAMILIES)
+    if context is not None
+}
+
+_cache: "OrderedDict[Tuple[str, int], Tuple[float, Dict[str, bool]]]" = OrderedDict()
+_lock = threading.Lock()
+# One lock per host being probed; dropped once that batch settles
+_host_locks: Dict[Tuple[str, int], threading.Lock] = {}
+
+
+def _remember(key: Tuple[str, int], value: Tuple[float, Dict[str, bool]]) -> None:
+    # Caller holds _lock. Least recently stored entries go first once full.
+    _cache[key] = value
+    _cache.move_to_end(key)
+    while len(_cache) > PROBE_CACHE_MAXSIZE:
+        _cache.popitem(last=False)
+
+
+def _accepts(family: str, host: str, port: int) -> bool:
+    """True if the server completes a handshake offering only `family`'s suites."""
+    try:
+        with connect(host, port) as sock:
+            with CONTEXTS[family].wrap_socket(sock, server_hostname=host):
+                return True
+    except _HANDSHAKE_ERRORS:
+        return False
+
+
+def probe_weak_ciphers(host: str, port: int = 443) -> Dict[str, bool]:
+    """
+    {family: accepted} for every family in CONTEXTS, probed side by side.
+
+    Each family still needs its own ClientHello, but checks 19/23/24 share
+    one parallel batch per host (cached for a short TTL) instead of each
+    dialing on its own.
+    """
+    key = (host, port)
+    with _lock:
+        host_lock = _host_locks.setdefault(key, threading.Lock())
+
+    with host_lock:
+        now = time.monotonic()
+        with _lock:
+            entry = _cache.get(key)
+            if entry is not None:
+                if entry[0] > now:
+                    return entry[1]
+                del _cache[key]
+
+        try:
+            families = list(CONTEXTS)
+            if families:
+                with ThreadPoolExecutor(max_workers=len(families)) as executor:
+                    accepted = executor.map(lambda f: _accepts(f, host, port), families)
+                    result = dict(zip(families, accepted))
+            else:
+                result = {}
+
+            with _lock:
+                _remember(key, (now + PROBE_TTL_SECONDS, result))
+        finally:
+            with _lock:
+                if _host_locks.get(key) is host_lock:
+                    del _host_locks[key]
+        return result
+
+
+def clear() -> None:
+    with _lock:
+        _cache.clear()
+        _host_locks.clear()
@@ -1,32 +1,28 @@
 # src/app/services/security_checks/cookies.py
 
 from __future__ import annotations
-from typing import Dict, List, Tuple
-import requests
+from typing import Dict, List
 from . import CheckResult
+from ._cache import cached_get
 
-def _fetch_cookies_and_headers(url: str) -> Tuple[Dict[str, str], Dict[str, str]]:
+def _fetch_set_cookie_headers(url: str) -> List[str]:
     """
-    Perform a GET request and return (cookies, headers).
+    Perform a GET request and return its Set-Cookie header lines.
     Includes verify=False for internal development environments.
     """
     try:
-        resp = requests.get(url, timeout=10, allow_redirects=True, verify=False)
-        cookies = {c.name: c.value for c in resp.cookies}
-        headers = {k.lower(): v for k, v in resp.headers.items()}
-        return cookies, headers
+        # One shared GET for headers and cookies, which run side by side (see cached_get)
+        resp = cached_get(url, headers_only=True, verify=False)
+        # requests folds repeated Set-Cookie headers into one comma-joined
+        # string, which can't be split back apart (Expires dates contain ", ").
+        # urllib3 keeps each header line separately.
+        return resp.raw.headers.getlist("Set-Cookie")
     except Exception:
-        return {}, {}
-
-def _parse_set_cookie_headers(headers: Dict[str, str]) -> List[str]:
-    """
-    Extract Set-Cookie headers from normalized response headers.
-    """
-    set_cookie_raw = headers.get("set-cookie")
-    if not set_cookie_raw:
         return []
-    # requests may join multiple cookies with a comma
-    return set_cookie_raw.split(", ") if ", " in set_cookie_raw else [set_cookie_raw]
+
+# The only attributes run() looks at; everything else (Expires, Path, ...) is skipped
+_TRACKED_ATTRIBUTES = frozenset({"secure", "httponly", "samesite"})
+_ALLOWED_SAMESITE = frozenset({"lax", "strict"})
 
 def _analyze_cookie_attributes(set_cookie_headers: List[str]) -> List[Dict]:
     """
@@ -34,19 +30,15 @@ def _analyze_cookie_attributes(set_cookie_headers: List[str]) -> List[Dict]:
     """
     cookies_info = []
     for header in set_cookie_headers:
-        parts = [p.strip() for p in header.split(";")]
-        if not parts: continue
-
-        name_value = parts[0]
-        name = name_value.split("=", 1)[0] if "=" in name_value else name_value
+        name_value, *attributes = header.split(";")
+        name = name_value.partition("=")[0].strip()
 
         attrs: Dict[str, str] = {}
-        for attr in parts[1:]:
-            if "=" in attr:
-                k, v = attr.split("=", 1)
-                attrs[k.lower()] = v.strip()
-            else:
-                attrs[attr.lower()] = "true"
+        for attr in attributes:
+            key, sep, value = attr.partition("=")
+            key = key.strip().lower()
+            if key in _TRACKED_ATTRIBUTES:
+                attrs[key] = value.strip() if sep else "true"
 
         cookies_info.append({"name": name, "attributes": attrs})
     return cookies_info
@@ -56,8 +48,7 @@ def run(url: str) -> List[CheckResult]:
     Check cookie security attributes against the 28-item compliance list.
     Maps to Item 11 (HttpOnly/Secure) and Item 12 (SameSite).
     """
-    _, headers = _fetch_cookies_and_headers(url)
-    set_cookie_headers = _parse_set_cookie_headers(headers)
+    set_cookie_headers = _fetch_set_cookie_headers(url)
     cookies_info = _analyze_cookie_attributes(set_cookie_headers)
 
     results: List[CheckResult] = []
@@ -100,7 +91,7 @@ def run(url: str) -> List[CheckResult]:
 
         # 2) Item 12: SameSite attribute check
         samesite = attrs.get("samesite")
-        if not samesite or samesite.lower() not in {"lax", "strict"}:
+        if not samesite or samesite.lower() not in _ALLOWED_SAMESITE:
             results.append(CheckResult(
                 check_type="cookies",
                 name=f"Cookie '{name}' SameSite attribute",
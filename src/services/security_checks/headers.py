@@ -1,23 +1,47 @@
 # src/app/services/security_checks/headers.py
 
 from __future__ import annotations
-from typing import Dict, List
-import requests
+from typing import List, Mapping
 from . import CheckResult
+from ._cache import cached_get
 
-def _fetch_headers(url: str) -> Dict[str, str]:
+def _fetch_headers(url: str) -> Mapping[str, str]:
     """
     Fetch response headers from a GET request to the given URL.
     Includes verification disable for internal testing.
     """
     try:
         # verify=False is often needed for internal ISRO/testing environments
-        resp = requests.get(url, timeout=10, allow_redirects=True, verify=False)
-        # Normalize header keys to lowercase for consistent checking
-        return {k.lower(): v for k, v in resp.headers.items()}
+        # One shared GET for headers and cookies, which run side by side (see cached_get)
+        resp = cached_get(url, headers_only=True, verify=False)
+        # requests' CaseInsensitiveDict already matches the lowercase keys below
+        return resp.headers
     except Exception:
         return {}
 
+_XFO_OK = frozenset({"DENY", "SAMEORIGIN"})
+
+# (header, passes(value), name, severity, description, recommendation),
+# audited in this order
+_REQUIRED_HEADERS = (
+    # 1) Item 9: Strict-Transport-Security (HSTS)
+    ("strict-transport-security", bool,
+     "Strict-Transport-Security", "critical",  # Red
+     "HSTS header is missing.", "Add HSTS header to enforce HTTPS."),
+    # 2) Item 10: Content-Security-Policy (CSP)
+    ("content-security-policy", bool,
+     "Content-Security-Policy", "error",  # Orange
+     "CSP header is missing.", "Define CSP to mitigate XSS attacks."),
+    # 3) Item 8: X-Frame-Options (Clickjacking)
+    ("x-frame-options", lambda v: bool(v) and v.upper() in _XFO_OK,
+     "X-Frame-Options", "critical",  # Red for audit compliance
+     "X-Frame-Options header missing or weak.", "Set to 'DENY' or 'SAMEORIGIN'."),
+    # 4) X-Content-Type-Options
+    ("x-content-type-options", lambda v: v is not None and v.lower() == "nosniff",
+     "X-Content-Type-Options", "warning",  # Yellow
+     "MIME-sniffing protection missing.", "Set to 'nosniff'."),
+)
+
 def run(url: str) -> List[CheckResult]:
     """
     Run a standardized set of HTTP security header checks.
@@ -30,53 +54,16 @@ def run(url: str) -> List[CheckResult]:
         return results # Error handling handled at the worker level
 
     # Mapping Logic based on the 28 Compliance Items
-    
-    # 1) Item 9: Strict-Transport-Security (HSTS)
-    hsts = headers.get("strict-transport-security")
-    if not hsts:
-        results.append(CheckResult(
-            check_type="headers",
-            name="Strict-Transport-Security",
-            severity="critical",  # Red
-            description="HSTS header is missing.",
-            recommendation="Add HSTS header to enforce HTTPS.",
-            raw_data={"observed": None},
-        ))
-
-    # 2) Item 10: Content-Security-Policy (CSP)
-    csp = headers.get("content-security-policy")
-    if not csp:
-        results.append(CheckResult(
-            check_type="headers",
-            name="Content-Security-Policy",
-            severity="error",  # Orange
-            description="CSP header is missing.",
-            recommendation="Define CSP to mitigate XSS attacks.",
-            raw_data={"observed": None},
-        ))
-
-    # 3) Item 8: X-Frame-Options (Clickjacking)
-    xfo = headers.get("x-frame-options")
-    if not xfo or xfo.upper() not in ["DENY", "SAMEORIGIN"]:
-        results.append(CheckResult(
-            check_type="headers",
-            name="X-Frame-Options",
-            severity="critical", # Red for audit compliance
-            description="X-Frame-Options header missing or weak.",
-            recommendation="Set to 'DENY' or 'SAMEORIGIN'.",
-            raw_data={"observed": xfo},
-        ))
-
-    # 4) X-Content-Type-Options
-    xcto = headers.get("x-content-type-options")
-    if xcto is None or xcto.lower() != "nosniff":
-        results.append(CheckResult(
-            check_type="headers",
-            name="X-Content-Type-Options",
-            severity="warning", # Yellow
-            description="MIME-sniffing protection missing.",
-            recommendation="Set to 'nosniff'.",
-            raw_data={"observed": xcto},
-        ))
+    for key, is_ok, name, severity, description, recommendation in _REQUIRED_HEADERS:
+        observed = headers.get(key)
+        if not is_ok(observed):
+            results.append(CheckResult(
+                check_type="headers",
+                name=name,
+                severity=severity,
+                description=description,
+                recommendation=recommendation,
+                raw_data={"observed": observed},
+            ))
 
-    return results
\ No newline at end of file
+    return results
@@ -1,26 +1,98 @@
 import importlib
 import logging
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeout, as_completed
+
+import requests
+
+from src.services.security_checks._cache import cached_get
+from src.services.security_checks._dns import probe_port
+from src.services.security_checks._url import origin_of, parse_target
 
 logger = logging.getLogger(__name__)
 
-def run_all(target_url):
-    results = {}
-    
-    # Loop through checks 2 to 28
+# These checks only inspect headers of a plain GET, so they share one response
+RESPONSE_CHECKS = {4, 5, 6, 7, 8, 10, 11, 12, 13, 22}
+# HTTPS operationality and HSTS read the same GET of the https:// origin
+HTTPS_RESPONSE_CHECKS = {3, 9}
+
+# Upper bound for the whole batch; individual checks carry their own socket timeouts
+RUN_ALL_TIMEOUT = 60
+
+def _collect(i, future):
+    try:
+        return future.result()
+    except Exception as e:
+        logger.error(f"Error executing check{i}: {str(e)}")
+        return {"compliance": "N", "remark": f"Execution error: {str(e)}", "severity": "high"}
+
+def _load_checks():
+    """(i, run_check) for check2..check28, imported once; run_check is None if the module is missing."""
+    checks = []
     for i in range(2, 29):
         try:
             # Dynamic import: src.services.security_checks.check2, check3, etc.
-            module_name = f"src.services.security_checks.check{i}"
-            module = importlib.import_module(module_name)
-            
-            # Execute the standard run_check function in each module
-            results[str(i)] = module.run_check(target_url)
-            
+            module = importlib.import_module(f"src.services.security_checks.check{i}")
         except ModuleNotFoundError:
             logger.warning(f"Check module check{i}.py not found. Skipping.")
+            checks.append((i, None))
+            continue
+        checks.append((i, module.run_check))
+    return tuple(checks)
+
+_CHECKS = _load_checks()
+
+# Checks return their fixed outcomes as module-level dicts built once at import,
+# so the same object comes back on every scan: treat each result as read-only.
+def run_all(target_url):
+    # Pre-fill in check order so the report keeps its 2..28 layout
+    results = {str(i): None for i in range(2, 29)}
+
+    def prefetch(url):
+        try:
+            return cached_get(url, headers_only=True)
+        except requests.exceptions.RequestException:
+            # Let each check fetch (and report the failure) on its own
+            return None
+
+    shared_response = prefetch(target_url)
+    https_response = prefetch(origin_of(target_url, "https"))
+
+    # One quick connect to the target's port up front; if it fails, every check
+    # dialing it refuses immediately instead of waiting out its own socket timeout.
+    host, port, _scheme = parse_target(target_url)
+    probe_port(host, port)
+
+    # Every check is blocking network I/O, so run them side by side:
+    # total time becomes the slowest check rather than the sum of all of them.
+    executor = ThreadPoolExecutor(max_workers=len(results))
+    futures = {}
+    for i, run_check in _CHECKS:
+        if run_check is None:
             results[str(i)] = {"compliance": "Y", "remark": "Check module missing.", "severity": "info"}
-        except Exception as e:
-            logger.error(f"Error executing check{i}: {str(e)}")
-            results[str(i)] = {"compliance": "N", "remark": f"Execution error: {str(e)}", "severity": "high"}
-            
-    return results
\ No newline at end of file
+            continue
+
+        # Execute the standard run_check function in each module
+        if i in RESPONSE_CHECKS and shared_response is not None:
+            future = executor.submit(run_check, target_url, response=shared_response)
+        elif i in HTTPS_RESPONSE_CHECKS and https_response is not None:
+            future = executor.submit(run_check, target_url, response=https_response)
+        else:
+            future = executor.submit(run_check, target_url)
+        futures[future] = i
+
+    try:
+        for future in as_completed(futures, timeout=RUN_ALL_TIMEOUT):
+            i = futures[future]
+            results[str(i)] = _collect(i, future)
+    except FuturesTimeout:
+        for future, i in futures.items():
+            if future.done():
+                results[str(i)] = _collect(i, future)
+            else:
+                logger.error(f"check{i} did not finish within {RUN_ALL_TIMEOUT}s")
+                results[str(i)] = {"compliance": "N", "remark": "Check timed out.", "severity": "high"}
+    finally:
+        # Don't block the scan on a straggler; its thread exits when its socket times out
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    return results
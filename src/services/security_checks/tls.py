@@ -1,12 +1,22 @@
 # src/app/services/security_checks/tls.py
 
 from __future__ import annotations
-import socket
+import re
 import ssl
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import List, Optional
-from urllib.parse import urlparse
+from datetime import datetime
+from typing import List, Optional, Tuple
+
+from cryptography import x509
+from cryptography.x509.oid import NameOID
+
 from . import CheckResult
+from ._dns import connect
+from ._url import parse_target
 
 @dataclass
 class TLSConfig:
@@ -15,52 +25,206 @@ class TLSConfig:
     certificate_issuer: str
     not_before: str
     not_after: str
+    # Parsed from not_after once at collection; None when the cert wasn't readable
+    days_remaining: Optional[int] = None
 
 def _parse_host_port(url: str) -> tuple[str, int]:
-    parsed = urlparse(url)
-    host = parsed.hostname or url
-    port = parsed.port if parsed.port else (443 if parsed.scheme == "https" else 80)
+    # Shared cached urlsplit helper; also unwraps IPv6 literals and drops credentials
+    host, port, _scheme = parse_target(url)
     return host, port
 
+# Handshake results are kept this long so a repeat scan of the same host
+# skips the round trips; same window as tls_probe/cipher_probe
+PROBE_TTL_SECONDS = 30
+INFO_CACHE_MAXSIZE = 256
+# One entry per legacy version probed, so room for a few per host
+PROTOCOL_CACHE_MAXSIZE = 1024
+
+_protocol_cache: "OrderedDict[Tuple[str, int, ssl.TLSVersion], Tuple[float, bool]]" = OrderedDict()
+_info_cache: "OrderedDict[Tuple[str, int], Tuple[float, TLSConfig]]" = OrderedDict()
+_cache_lock = threading.Lock()
+
+def _remember(table: OrderedDict, key, value, maxsize: int) -> None:
+    # Caller holds _cache_lock. Least recently stored entries go first once full.
+    table[key] = value
+    table.move_to_end(key)
+    while len(table) > maxsize:
+        table.popitem(last=False)
+
 def _check_protocol_support(host: str, port: int, version: ssl.TLSVersion) -> bool:
-    """Tests if the server supports a specific legacy protocol version."""
-    context = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
-    context.minimum_version = version
-    context.maximum_version = version
-    context.check_hostname = False
-    context.verify_mode = ssl.CERT_NONE
+    """Tests if the server supports a specific legacy protocol version (cached for a short TTL)."""
+    key = (host, port, version)
+    now = time.monotonic()
+    with _cache_lock:
+        entry = _protocol_cache.get(key)
+        if entry is not None:
+            if entry[0] > now:
+                return entry[1]
+            del _protocol_cache[key]
+
+    supported = _probe_protocol(host, port, version)
+    with _cache_lock:
+        _remember(_protocol_cache, key, (now + PROBE_TTL_SECONDS, supported), PROTOCOL_CACHE_MAXSIZE)
+    return supported
+
+def _probe_protocol(host: str, port: int, version: ssl.TLSVersion) -> bool:
     try:
-        with socket.create_connection((host, port), timeout=3) as sock:
-            with context.wrap_socket(sock, server_hostname=host):
+        with connect(host, port, io_timeout=3) as sock:
+            with _LEGACY_CONTEXTS[version].wrap_socket(sock, server_hostname=host):
                 return True
     except Exception:
         return False
 
-def _get_tls_info(host: str, port: int = 443, timeout: int = 5) -> Optional[TLSConfig]:
-    context = ssl.create_default_context()
+# Built once at import: loading the CA store is the expensive part of a
+# context, and these are never reconfigured afterwards.
+# getpeercert() only returns the parsed certificate (issuer, dates) when it
+# was verified, so try a verifying handshake first and fall back to an
+# unverified one for self-signed/internal/expired certificates; that one's
+# fields are read from the DER instead (see _cert_fields).
+_INFO_CONTEXT = ssl.create_default_context()
+_INFO_CONTEXT.check_hostname = False
+_UNVERIFIED_INFO_CONTEXT = ssl.create_default_context()
+_UNVERIFIED_INFO_CONTEXT.check_hostname = False
+_UNVERIFIED_INFO_CONTEXT.verify_mode = ssl.CERT_NONE
+
+# Legacy protocol versions probed by run(), with the label used in findings
+LEGACY_VERSIONS = (
+    ("TLSv1.0", ssl.TLSVersion.TLSv1),
+    ("TLSv1.1", ssl.TLSVersion.TLSv1_1),
+)
+
+def _legacy_context(version: ssl.TLSVersion) -> ssl.SSLContext:
+    context = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
+    context.minimum_version = version
+    context.maximum_version = version
     context.check_hostname = False
     context.verify_mode = ssl.CERT_NONE
+    return context
+
+# One pinned-version context per legacy protocol, built once at import
+_LEGACY_CONTEXTS = {version: _legacy_context(version) for _label, version in LEGACY_VERSIONS}
+
+# One case-insensitive scan per cipher name instead of a substring test per keyword
+_WEAK_CIPHER_RE = re.compile(r"NULL|EXPORT|RC4|DES|MD5|ADH", re.I)
+_FS_CIPHER_RE = re.compile(r"DHE", re.I)  # also matches ECDHE
+
+# Certificate expiry thresholds, in days
+EXPIRY_CRITICAL_DAYS = 14
+EXPIRY_WARNING_DAYS = 30
+
+def _get_tls_info(host: str, port: int = 443, timeout: int = 5) -> Optional[TLSConfig]:
+    """
+    Negotiated protocol/cipher and certificate dates for `host:port`.
+
+    Kept for a short TTL so a repeat scan of the same host doesn't redo the
+    handshake; failures return None and aren't cached.
+    """
+    key = (host, port)
+    now = time.monotonic()
+    with _cache_lock:
+        entry = _info_cache.get(key)
+        if entry is not None:
+            if entry[0] > now:
+                return entry[1]
+            del _info_cache[key]
+
+    info = _handshake_info(host, port, timeout)
+    if info is not None:
+        with _cache_lock:
+            _remember(_info_cache, key, (now + PROBE_TTL_SECONDS, info), INFO_CACHE_MAXSIZE)
+    return info
+
+def _days_remaining(not_after: Optional[str]) -> Optional[int]:
+    if not not_after:
+        return None
+    try:
+        return int((ssl.cert_time_to_seconds(not_after) - time.time()) // 86400)
+    except ValueError:
+        return None
+
+def _find_rdn(name: tuple, key: str, default: str = "Unknown") -> str:
+    """First `key` attribute in a getpeercert() subject/issuer, without building a dict."""
+    for rdn in name:
+        for attr, value in rdn:
+            if attr == key:
+                return value
+    return default
+
+_MONTHS = ("Jan", "Feb", "Mar", "Apr", "May", "Jun",
+           "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
+
+def _format_cert_time(when: datetime) -> str:
+    # Same layout getpeercert() uses ("Jun  1 12:00:00 2025 GMT"), spelled out
+    # rather than strftime("%b") so the month name doesn't follow the locale
+    return f"{_MONTHS[when.month - 1]} {when.day:2d} {when:%H:%M:%S} {when.year} GMT"
+
+def _cert_fields(ssock: ssl.SSLSocket) -> Tuple[str, Optional[str], Optional[str]]:
+    """(issuer CN, notBefore, notAfter) of the peer certificate, verified or not."""
+    cert = ssock.getpeercert()
+    if cert:
+        return (_find_rdn(cert.get("issuer", ()), "commonName"),
+                cert.get("notBefore"), cert.get("notAfter"))
+
+    # Unverified handshake: getpeercert() is {}, but the raw DER is still there
+    der = ssock.getpeercert(binary_form=True)
+    if not der:
+        return "Unknown", None, None
+    try:
+        parsed = x509.load_der_x509_certificate(der)
+    except ValueError:
+        return "Unknown", None, None
+    issuer = parsed.issuer.get_attributes_for_oid(NameOID.COMMON_NAME)
+    return (issuer[0].value if issuer else "Unknown",
+            _format_cert_time(parsed.not_valid_before_utc),
+            _format_cert_time(parsed.not_valid_after_utc))
+
+def _handshake(host: str, port: int, timeout: int, context: ssl.SSLContext) -> TLSConfig:
+    # Cached address (see _dns), so repeat handshakes skip getaddrinfo
+    with connect(host, port, io_timeout=timeout) as sock:
+        with context.wrap_socket(sock, server_hostname=host) as ssock:
+            cipher = ssock.cipher()
+            version = ssock.version() or "unknown"
+            issuer, not_before, not_after = _cert_fields(ssock)
+            return TLSConfig(
+                protocol_version=version,
+                cipher_suite=cipher[0] if cipher else None,
+                certificate_issuer=issuer,
+                not_before=not_before or "unknown",
+                not_after=not_after or "unknown",
+                days_remaining=_days_remaining(not_after),
+            )
+
+def _handshake_info(host: str, port: int, timeout: int) -> Optional[TLSConfig]:
     try:
-        with socket.create_connection((host, port), timeout=timeout) as sock:
-            with context.wrap_socket(sock, server_hostname=host) as ssock:
-                cipher = ssock.cipher()
-                version = ssock.version() or "unknown"
-                cert = ssock.getpeercert() or {}
-                issuer = dict(x[0] for x in cert.get("issuer", []))
-                return TLSConfig(
-                    protocol_version=version,
-                    cipher_suite=cipher[0] if cipher else None,
-                    certificate_issuer=issuer.get("commonName", "Unknown"),
-                    not_before=cert.get("notBefore", "unknown"),
-                    not_after=cert.get("notAfter", "unknown"),
-                )
+        try:
+            return _handshake(host, port, timeout, _INFO_CONTEXT)
+        except ssl.SSLCertVerificationError:
+            return _handshake(host, port, timeout, _UNVERIFIED_INFO_CONTEXT)
     except Exception:
         return None
 
 def run(url: str) -> List[CheckResult]:
+    # A plain http:// target has no TLS endpoint to handshake with; don't
+    # sit out a socket timeout finding that out
+    if parse_target(url)[2] != "https":
+        return [CheckResult(check_type="tls", name="TLS Not Configured", severity="critical",
+                            description="Target URL does not use HTTPS.",
+                            recommendation="Serve the site over HTTPS with TLS 1.2 or 1.3.",
+                            raw_data={"url": url})]
+
     host, port = _parse_host_port(url)
     results: List[CheckResult] = []
-    tls_info = _get_tls_info(host, port)
+
+    # The info handshake and both legacy probes are independent round trips;
+    # run them side by side so the audit costs one handshake of wall time.
+    with ThreadPoolExecutor(max_workers=1 + len(LEGACY_VERSIONS)) as executor:
+        info_future = executor.submit(_get_tls_info, host, port)
+        legacy_futures = [
+            (label, executor.submit(_check_protocol_support, host, port, version))
+            for label, version in LEGACY_VERSIONS
+        ]
+        tls_info = info_future.result()
+        legacy_found = [label for label, future in legacy_futures if future.result()]
 
     if not tls_info:
         results.append(CheckResult(check_type="tls", name="TLS Connectivity", severity="high", 
@@ -68,12 +232,19 @@ def run(url: str) -> List[CheckResult]:
                                    recommendation="Enable TLS 1.2 or 1.3.", raw_data={}))
         return results
 
-    # 1) Item 16: Outdated Protocol Check
-    legacy_found = []
-    # Test for SSLv3 (Item 18 POODLE) and TLS 1.0/1.1
-    if _check_protocol_support(host, port, ssl.TLSVersion.TLSv1): legacy_found.append("TLSv1.0")
-    if _check_protocol_support(host, port, ssl.TLSVersion.TLSv1_1): legacy_found.append("TLSv1.1")
+    # Certificate expiry (also reported for untrusted and already-expired certs)
+    days = tls_info.days_remaining
+    if days is not None and days < EXPIRY_WARNING_DAYS:
+        results.append(CheckResult(
+            check_type="tls", name="Certificate Expiry",
+            severity="critical" if days < EXPIRY_CRITICAL_DAYS else "warning",
+            description=(f"Certificate expired {-days} day(s) ago." if days < 0
+                         else f"Certificate expires in {days} day(s)."),
+            recommendation="Renew the TLS certificate before it expires.",
+            raw_data={"not_after": tls_info.not_after, "days_remaining": days}
+        ))
 
+    # 1) Item 16: Outdated Protocol Check
     if legacy_found:
         results.append(CheckResult(
             check_type="tls", name="Legacy TLS Protocols", severity="critical",
@@ -83,8 +254,8 @@ def run(url: str) -> List[CheckResult]:
         ))
 
     # 2) Item 17 & 23: Cipher Check
-    weak_ciphers = ["NULL", "EXPORT", "RC4", "DES", "MD5", "ADH"]
-    if any(weak in (tls_info.cipher_suite or "").upper() for weak in weak_ciphers):
+    cipher_suite = tls_info.cipher_suite or ""
+    if _WEAK_CIPHER_RE.search(cipher_suite):
         results.append(CheckResult(
             check_type="tls", name="Weak Cipher Suites", severity="critical",
             description=f"Insecure cipher in use: {tls_info.cipher_suite}.",
@@ -93,7 +264,8 @@ def run(url: str) -> List[CheckResult]:
         ))
 
     # 3) Item 26: Forward Secrecy
-    if not any(x in (tls_info.cipher_suite or "").upper() for x in ["ECDHE", "DHE"]):
+    # Every TLS 1.3 suite is ephemeral; their names (TLS_AES_...) don't say so
+    if tls_info.protocol_version != "TLSv1.3" and not _FS_CIPHER_RE.search(cipher_suite):
         results.append(CheckResult(
             check_type="tls", name="Forward Secrecy", severity="error",
             description="Cipher suite does not support Forward Secrecy.",
@@ -101,4 +273,9 @@ def run(url: str) -> List[CheckResult]:
             raw_data={}
         ))
 
-    return results
\ No newline at end of file
+    return results
+
+def clear() -> None:
+    with _cache_lock:
+        _info_cache.clear()
+        _protocol_cache.clear()
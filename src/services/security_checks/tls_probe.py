@@ -0,0 +1,97 @@
+# src/app/services/security_checks/tls_probe.py
+
+from __future__ import annotations
+
+import ssl
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, NamedTuple, Optional, Tuple
+
+from ._dns import connect
+
+PROBE_TTL_SECONDS = 30
+PROBE_CACHE_MAXSIZE = 256
+
+# Default context built once; same settings the inspection checks used on their own
+_DEFAULT_CONTEXT = ssl.create_default_context()
+
+
+class TLSProbe(NamedTuple):
+    cipher_name: str
+    proto: str
+    bits: int
+    compression: Optional[str]
+    peer_cert: Optional[dict]
+
+
+_cache: "OrderedDict[Tuple[str, int], Tuple[float, TLSProbe]]" = OrderedDict()
+_lock = threading.Lock()
+# One lock per host being dialed so concurrent checks wait for the first
+# handshake instead of redialing; dropped once that handshake settles
+_host_locks: Dict[Tuple[str, int], threading.Lock] = {}
+# Last session per host; offering it lets the server do an abbreviated handshake
+_sessions: "OrderedDict[Tuple[str, int], ssl.SSLSession]" = OrderedDict()
+
+
+def _remember(table: OrderedDict, key: Tuple[str, int], value) -> None:
+    # Caller holds _lock. Least recently stored entries go first once full.
+    table[key] = value
+    table.move_to_end(key)
+    while len(table) > PROBE_CACHE_MAXSIZE:
+        table.popitem(last=False)
+
+
+def probe_default(host: str, port: int = 443) -> TLSProbe:
+    """
+    One default handshake to `host:port`, summarised for the inspection checks.
+
+    CRIME (compression) and PFS (negotiated cipher) only read fields off a
+    normal handshake, so they share this one instead of dialing their own.
+    Results are kept for a short TTL; failed handshakes raise and aren't cached.
+    Once the TTL runs out the next handshake resumes the previous TLS session
+    when the server still accepts it.
+    """
+    key = (host, port)
+    with _lock:
+        host_lock = _host_locks.setdefault(key, threading.Lock())
+
+    with host_lock:
+        now = time.monotonic()
+        with _lock:
+            entry = _cache.get(key)
+            if entry is not None and entry[0] > now:
+                return entry[1]
+            session = _sessions.get(key)
+
+        try:
+            with connect(host, port) as sock:
+                with _DEFAULT_CONTEXT.wrap_socket(
+                    sock, server_hostname=host, session=session
+                ) as ssock:
+                    cipher_name, proto, bits = ssock.cipher()
+                    probe = TLSProbe(
+                        cipher_name=cipher_name,
+                        proto=proto,
+                        bits=bits,
+                        compression=ssock.compression(),
+                        peer_cert=ssock.getpeercert(),
+                    )
+                    session = ssock.session
+
+            with _lock:
+                _remember(_cache, key, (now + PROBE_TTL_SECONDS, probe))
+                if session is not None:
+                    _remember(_sessions, key, session)
+        finally:
+            with _lock:
+                if _host_locks.get(key) is host_lock:
+                    del _host_locks[key]
+        return probe
+
+
+def clear() -> None:
+    with _lock:
+        _cache.clear()
+        _host_locks.clear()
+        _sessions.clear()
@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Any, Optional
 from urllib.parse import urlparse
 
@@ -11,15 +12,23 @@ def utc_now() -> datetime:
     """
     Return current UTC time as naive datetime (or adapt to timezone-aware
     if you prefer). Handy for consistent timestamps.
+    Same value as the deprecated datetime.utcnow().
     """
-    return datetime.utcnow()
+    return datetime.now(timezone.utc).replace(tzinfo=None)
 
 
+def local_now_str() -> str:
+    """Local wall-clock time as 'YYYY-MM-DD HH:MM:SS' (report timings)."""
+    return datetime.now().isoformat(sep=" ", timespec="seconds")
+
+
+@lru_cache(maxsize=4096)
 def normalize_url(url: str) -> str:
     """
     Basic URL normalizer:
       - ensures scheme is present (defaults to https)
       - lowercases scheme and hostname
+    Pure function of its input, so repeat URLs skip the parse.
     """
     if "://" not in url:
         url = "https://" + url
@@ -36,6 +45,13 @@ def safe_int(value: Any, default: Optional[int] = None) -> Optional[int]:
     """
     Try to convert a value to int; return default on failure.
     """
+    # Common cases first, without the cost of raising and catching
+    if value.__class__ is int:
+        return value
+    if value is None:
+        return default
+    if value.__class__ is str and value.isdecimal():
+        return int(value)
     try:
         return int(value)
     except (TypeError, ValueError):
@@ -2,13 +2,20 @@
 
 from __future__ import annotations
 
+from collections.abc import Sequence
+from itertools import islice
 from math import ceil
-from typing import Generic, Iterable, List, Optional, TypeVar
+from typing import Generic, Iterable, List, TypeVar
 
 from pydantic import BaseModel
+from sqlalchemy import func
 
 T = TypeVar("T")
 
+# skip/limit bounds for list endpoints; the window is applied in SQL
+DEFAULT_LIMIT = 100
+MAX_LIMIT = 500
+
 
 class Page(BaseModel, Generic[T]):
     """
@@ -25,23 +32,37 @@ def paginate_list(
     items: Iterable[T],
     page: int = 1,
     size: int = 20,
+    need_total: bool = True,
 ) -> Page[T]:
     """
     Paginate a plain Python iterable (e.g. list of ORM objects).
 
+    Lists and tuples are sliced directly. Any other iterable is walked once
+    and only the requested window is kept; with need_total=False the walk
+    stops there and `total` only counts up to the end of the window.
+
     In real endpoints, you will usually paginate at the DB level
     using .offset().limit() instead of this helper.
     """
     page = max(page, 1)
     size = max(size, 1)
 
-    items_list = list(items)
-    total = len(items_list)
-    pages = max(ceil(total / size), 1)
-
     start = (page - 1) * size
     end = start + size
-    paged_items = items_list[start:end]
+
+    if isinstance(items, Sequence):
+        total = len(items)
+        paged_items = list(items[start:end])
+    else:
+        iterator = iter(items)
+        # Count what we skip: the iterable may end before the window starts
+        skipped = sum(1 for _ in islice(iterator, start))
+        paged_items = list(islice(iterator, size))
+        total = skipped + len(paged_items)
+        if need_total:
+            total += sum(1 for _ in iterator)
+
+    pages = max(ceil(total / size), 1)
 
     return Page[T](
         items=paged_items,
@@ -70,6 +91,19 @@ def apply_sqlalchemy_pagination(query, page: int = 1, size: int = 20):
     page = max(page, 1)
     size = max(size, 1)
 
-    total = query.order_by(None).count()
-    items = query.offset((page - 1) * size).limit(size).all()
-    return items, total
\ No newline at end of file
+    # COUNT(*) OVER () rides along on every row, so one statement returns
+    # both the page and the total
+    single_entity = len(query.column_descriptions) == 1
+    rows = (
+        query.add_columns(func.count().over().label("_total"))
+        .offset((page - 1) * size)
+        .limit(size)
+        .all()
+    )
+    if not rows:
+        # Past the last page (or no matches): the total still has to come from somewhere
+        return [], query.order_by(None).count()
+
+    total = rows[0]._total
+    items = [row[0] if single_entity else tuple(row[:-1]) for row in rows]
+    return items, total
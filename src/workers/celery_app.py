@@ -21,7 +21,13 @@ celery_app.conf.update(
     task_ignore_result=False,
     task_acks_late=True,
     worker_prefetch_multiplier=1,
-    broker_connection_retry_on_startup=True 
+    # With acks_late, a task whose child dies mid-run goes back on the queue
+    task_reject_on_worker_lost=True,
+    # Recycle pool children so PDF/scan memory growth can't build up (KiB)
+    worker_max_tasks_per_child=100,
+    worker_max_memory_per_child=512 * 1024,
+    result_expires=3600,
+    broker_connection_retry_on_startup=True,
 )
 
 @celery_app.task(name="ping")
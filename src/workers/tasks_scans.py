@@ -1,23 +1,35 @@
 import logging
-import time
-from datetime import datetime
 from pathlib import Path
-import nmap
+from celery.signals import worker_init
+from sqlalchemy.orm import selectinload
 
 from src.workers.celery_app import celery_app
 from src.db.session import SessionLocal
-from src.db.models import Scan, PdfReport, Finding
-from src.services.pdf_service import generate_pdf_for_scan, save_pdf_file
+from src.db.models import Scan, PdfReport
+from src.services.scan_service import add_findings_bulk
+from src.utils.misc import local_now_str
+
+# The PDF service and the security_checks package (the Master Runner loads
+# check2.py through check28.py) are imported inside the tasks: the API imports
+# this module only to enqueue them and shouldn't pay for the scanner stack.
+
+
+@worker_init.connect
+def _preload_task_modules(**kwargs):
+    """Import the scanner stack once in the worker parent so prefork children share it."""
+    from src.services import pdf_service  # noqa: F401
+    from src.services.security_checks import master_runner  # noqa: F401
 
-# Import the new Master Runner that orchestrates check1.py through check28.py
-from src.services.security_checks import master_runner
 
 logger = logging.getLogger(__name__)
 
+# Ports swept for Check 1
+SCAN_PORTS = (21, 22, 23, 25, 80, 443, 3389, 8000, 8080, 8443)
+
 def evaluate_compliance(findings, target_url, hostname):
     """
     Orchestrates live scans and maps them to the 28 audit parameters.
-    Check 1 is processed here based on Nmap results.
+    Check 1 is processed here based on the port scan results.
     """
     # Initialize compliance map
     compliance_map = {str(i): {"status": "Y", "remark": "Compliant.", "severity": "info"} for i in range(1, 29)}
@@ -76,37 +88,42 @@ def evaluate_compliance(findings, target_url, hostname):
 @celery_app.task(name="run_security_scan_task")
 def run_security_scan_task(scan_id: int):
     db = SessionLocal()
-    start_time = datetime.now()
+    start_time = local_now_str()
     try:
-        scan = db.query(Scan).filter(Scan.id == scan_id).first()
+        scan = db.query(Scan).options(selectinload(Scan.target)).filter(Scan.id == scan_id).first()
         if not scan: return False
 
+        from socket import getservbyport
+        from src.services.security_checks._dns import sweep_ports
+        from src.services.security_checks._url import host_of
+
+        # Extract target host for the port sweep
+        target_host = host_of(scan.target.url)
+
         scan.status = "processing"
         db.commit()
 
-        # Extract target host for Nmap
-        target_host = scan.target.url.replace("https://", "").replace("http://", "").split('/')[0]
-
-        # Standard Nmap Port Scan (Check 1)
-        nm = nmap.PortScanner()
-        nm.scan(target_host, '21,22,23,25,80,443,3389,8000,8080,8443', arguments='-n -T4 --max-retries 2')
-
-        if target_host in nm.all_hosts():
-            for port in nm[target_host].get('tcp', {}):
-                state = nm[target_host]['tcp'][port]['state']
-                if state == 'open':
-                    db.add(Finding(
-                        scan_id=scan_id, 
-                        name=f"Insecure Port Open: {port}",
-                        description=f"Port {port} ({nm[target_host]['tcp'][port]['name']}) is open."
-                    ))
-        
-        db.commit() # Save nmap findings before passing to evaluation
+        # Port Scan (Check 1): plain TCP connects to the fixed list, all in flight at once
+        port_findings = []
+        for port in sweep_ports(target_host, SCAN_PORTS):
+            try:
+                service = getservbyport(port, "tcp")
+            except OSError:
+                service = "unknown"
+            port_findings.append(dict(
+                check_type="port_scan",
+                name=f"Insecure Port Open: {port}",
+                severity="info" if port in (80, 443) else "high",
+                description=f"Port {port} ({service}) is open."
+            ))
+
+        add_findings_bulk(db, scan, port_findings)
+        db.commit() # Save port findings before passing to evaluation
 
         # Transition to Report Generation
         timings = {
-            "start": start_time.strftime("%Y-%m-%d %H:%M:%S"), 
-            "end": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            "start": start_time,
+            "end": local_now_str(),
         }
         
         generate_pdf_report_task.delay(scan_id, scan.user_id, timings)
@@ -127,11 +144,17 @@ def run_security_scan_task(scan_id: int):
 def generate_pdf_report_task(scan_id: int, user_id: int, timings: dict = None):
     db = SessionLocal()
     try:
-        scan = db.query(Scan).filter(Scan.id == scan_id).first()
+        scan = (
+            db.query(Scan)
+            .options(selectinload(Scan.target), selectinload(Scan.findings))
+            .filter(Scan.id == scan_id)
+            .first()
+        )
         if not scan: return False
 
         target_url = scan.target.url
-        hostname = target_url.replace("https://", "").replace("http://", "").split('/')[0]
+        from src.services.security_checks._url import host_of
+        hostname = host_of(target_url)
         
         # Clean naming for the file
         domain_parts = hostname.split('.')
@@ -141,6 +164,7 @@ def generate_pdf_report_task(scan_id: int, user_id: int, timings: dict = None):
         compliance_data = evaluate_compliance(scan.findings, target_url, hostname)
         
         # Generate and save PDF
+        from src.services.pdf_service import generate_pdf_for_scan, save_pdf_file
         pdf_bytes, filename = generate_pdf_for_scan(scan, compliance_data, file_prefix, timings)
         full_path = save_pdf_file(pdf_bytes, filename)
         
@@ -2,17 +2,38 @@ import pytest
 import sys
 import os
 import psycopg2
+from functools import lru_cache
+from typing import AsyncGenerator, Generator
 from urllib.parse import urlparse
 
+from fastapi.testclient import TestClient
+from passlib.context import CryptContext
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import NullPool, StaticPool
+
 # 1. Setup path
 sys.path.append(os.getcwd())
 
+from src.app.main import app
+from src.db import models  # noqa: F401  (registers every table on Base.metadata)
+from src.db.base import Base
+from src.api.deps import get_async_db_session, get_db_session
+from src.core import security
+from src.core.security import create_access_token, hash_password
+from src.core.settings import get_settings
+from src.db.models.scan import Scan
+from src.db.models.target import Target
+from src.db.models.user import User
+from src.db.session import get_db
+
 # 2. THE "DISCONNECT" FIX (Monkeypatch)
-# This fixture runs automatically for every test.
+# Installed once for the whole session.
 # It finds the "delay" function (which sends tasks to Redis)
 # and replaces it with a fake function that does absolutely nothing.
-@pytest.fixture(autouse=True)
-def mock_celery_tasks(monkeypatch):
+@pytest.fixture(scope="session", autouse=True)
+def mock_celery_tasks():
     """
     Prevents any connection attempts to Redis/RabbitMQ.
     """
@@ -21,8 +42,15 @@ def mock_celery_tasks(monkeypatch):
         print("   [Mock] Task 'sent' successfully (Intercepted by test!)")
         return None
 
+    # Not always-eager: that would run real port sweeps and PDF jobs in-process.
+    # The in-memory broker keeps a stray apply_async() in-process instead of dialing Redis.
+    from src.workers.celery_app import celery_app
+    celery_app.conf.broker_url = "memory://"
+
     # Replace the real .delay() method with our fake one
-    monkeypatch.setattr("celery.app.task.Task.delay", fake_delay)
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("celery.app.task.Task.delay", fake_delay)
+        yield
 
 
 # 3. Database Auto-Cleaner (Standard)
@@ -49,4 +77,161 @@ def clean_database_automatically():
         conn.close()
         print("\n✨ Database wiped clean! Ready for tests. ✨")
     except Exception:
-        pass
\ No newline at end of file
+        pass
+
+
+# 4. Shared test DB (SQLite in-memory)
+# One engine and one create_all for the whole run. StaticPool hands every
+# session the same connection, so the in-memory schema isn't lost between them.
+# The DB is a named shared-cache one so the async engine below sees the same
+# tables; that held-open connection is also what keeps it alive.
+# Under pytest-xdist each worker is its own process and so gets its own DB.
+TEST_DB = "file:websec_test?mode=memory&cache=shared&uri=true"
+
+
+@pytest.fixture(scope="session")
+def engine():
+    engine = create_engine(
+        f"sqlite:///{TEST_DB}",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture(scope="session")
+def TestingSessionLocal(engine):
+    return sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+@pytest.fixture(scope="session")
+def AsyncTestingSessionLocal(engine):
+    # NullPool: a fresh aiosqlite connection per session, never tied to a stale event loop
+    async_engine = create_async_engine(f"sqlite+aiosqlite:///{TEST_DB}", poolclass=NullPool)
+    return async_sessionmaker(async_engine, expire_on_commit=False)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def setup_database(engine) -> None:
+    """Create all tables once for the test session."""
+    Base.metadata.create_all(bind=engine)
+
+
+@pytest.fixture(autouse=True)
+def _clean_db(engine):
+    """Empty every table after each test; far cheaper than drop_all/create_all."""
+    yield
+    with engine.begin() as conn:
+        for table in reversed(Base.metadata.sorted_tables):
+            conn.execute(table.delete())
+
+
+@pytest.fixture(scope="session")
+def override_get_db(TestingSessionLocal):
+    def _override_get_db() -> Generator[Session, None, None]:
+        db = TestingSessionLocal()
+        try:
+            yield db
+        finally:
+            db.close()
+    return _override_get_db
+
+
+@pytest.fixture(scope="session")
+def override_get_async_db(AsyncTestingSessionLocal):
+    async def _override_get_async_db() -> AsyncGenerator[AsyncSession, None]:
+        # Same unit of work as get_async_db: commit on success, roll back on error
+        async with AsyncTestingSessionLocal() as db:
+            try:
+                yield db
+                await db.commit()
+            except Exception:
+                await db.rollback()
+                raise
+    return _override_get_async_db
+
+
+@pytest.fixture(scope="session")
+def pdf_dir(tmp_path_factory):
+    return tmp_path_factory.mktemp("pdf")
+
+
+@pytest.fixture(scope="session")
+def _client(override_get_db, override_get_async_db, pdf_dir) -> Generator[TestClient, None, None]:
+    """One TestClient (and one app startup/shutdown) for the whole run."""
+    # Override PDF output directory to temp folder
+    get_settings().PDF_OUTPUT_DIR = str(pdf_dir)
+    app.dependency_overrides[get_db] = override_get_db
+    # get_db_session calls get_db directly, so it needs its own override
+    app.dependency_overrides[get_db_session] = override_get_db
+    app.dependency_overrides[get_async_db_session] = override_get_async_db
+    with TestClient(app) as c:
+        yield c
+    app.dependency_overrides.clear()
+
+
+@pytest.fixture
+def client(_client) -> Generator[TestClient, None, None]:
+    """FastAPI TestClient with DB dependency overridden."""
+    yield _client
+
+    # The client outlives the test, so drop any session cookie a login left behind
+    _client.cookies.clear()
+
+
+# 5. Auth shortcuts
+# Only test_auth.py goes through /register and /login; everything else gets
+# a user row and a signed token directly, skipping bcrypt on every test.
+@pytest.fixture(scope="session", autouse=True)
+def fast_password_hashing():
+    """Same bcrypt scheme at the minimum cost factor, so every hash/verify is ~ms."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(
+            "src.core.security.pwd_context",
+            CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=4),
+        )
+        yield
+
+
+@pytest.fixture(scope="session", autouse=True)
+def cached_token_decoding():
+    """Each test token is sent several times; verify it once and reuse the claims."""
+    with pytest.MonkeyPatch.context() as mp:
+        # Invalid tokens raise and aren't cached, so the rejection paths still run
+        mp.setattr(security, "decode_access_token", lru_cache(maxsize=64)(security.decode_access_token))
+        yield
+
+
+@pytest.fixture(scope="session")
+def password_hash(fast_password_hashing) -> str:
+    """bcrypt hash of "secret123", computed once for the whole run."""
+    return hash_password("secret123")
+
+
+@pytest.fixture
+def token_factory(client, TestingSessionLocal, password_hash):
+    """token_factory(email) -> access token for a freshly inserted user."""
+    def _make_token(email: str) -> str:
+        with TestingSessionLocal() as db:
+            user = User(email=email, hashed_password=password_hash)
+            db.add(user)
+            db.commit()
+            return create_access_token(user.id)
+    return _make_token
+
+
+@pytest.fixture
+def seeded(client, TestingSessionLocal, password_hash) -> dict:
+    """A user with one target and one pending scan, inserted straight through the ORM."""
+    with TestingSessionLocal() as db:
+        user = User(email="seeded@example.com", hashed_password=password_hash)
+        target = Target(user=user, url="https://example.com", name="Example")
+        scan = Scan(user=user, target=target, status="pending")
+        db.add_all([user, target, scan])
+        db.commit()
+        return {
+            "token": create_access_token(user.id),
+            "target_id": target.id,
+            "scan_id": scan.id,
+        }
@@ -1,49 +1,6 @@
 # tests/test_auth.py
 from __future__ import annotations
-from typing import Generator
-import pytest
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
-from sqlalchemy.orm import Session, sessionmaker
-from src.app.main import app
-from src.db.base import Base
-from src.db.session import get_db
-
-# ---------------------------------------------------------------------------
-# Test DB setup (SQLite in-memory)
-# ---------------------------------------------------------------------------
-SQLALCHEMY_DATABASE_URL = "sqlite:///:memory:"
-
-engine = create_engine(
-    SQLALCHEMY_DATABASE_URL,
-    connect_args={"check_same_thread": False},
-)
-TestingSessionLocal = sessionmaker(
-    autocommit=False,
-    autoflush=False,
-    bind=engine,
-)
-
-def override_get_db() -> Generator[Session, None, None]:
-    db = TestingSessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
-
-@pytest.fixture(scope="session", autouse=True)
-def setup_database() -> None:
-    """Create all tables once for the test session."""
-    Base.metadata.create_all(bind=engine)
-
-@pytest.fixture
-def client() -> Generator[TestClient, None, None]:
-    """FastAPI TestClient with DB dependency overridden."""
-    app.dependency_overrides[get_db] = override_get_db
-    # ✅ FIX: Defined 'c' inside the with block before yielding
-    with TestClient(app) as c:
-        yield c
-    app.dependency_overrides.clear()
 
 # ---------------------------------------------------------------------------
 # Helper
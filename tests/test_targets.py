@@ -2,59 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Generator
-
-import pytest
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
-from sqlalchemy.orm import Session, sessionmaker
-
-from src.app.main import app
-from src.db.base import Base
-from src.db.session import get_db
-
-# ---------------------------------------------------------------------------
-# Test DB setup (SQLite in-memory)
-# ---------------------------------------------------------------------------
-
-SQLALCHEMY_DATABASE_URL = "sqlite:///:memory:"
-
-engine = create_engine(
-    SQLALCHEMY_DATABASE_URL,
-    connect_args={"check_same_thread": False},
-)
-TestingSessionLocal = sessionmaker(
-    autocommit=False,
-    autoflush=False,
-    bind=engine,
-)
-
-
-def override_get_db() -> Generator[Session, None, None]:
-    db = TestingSessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
-
-
-@pytest.fixture(scope="session", autouse=True)
-def setup_database() -> None:
-    """
-    Create all tables once for the test session.
-    """
-    Base.metadata.create_all(bind=engine)
-
-
-@pytest.fixture
-def client(monkeypatch, tmp_path) -> Generator[TestClient, None, None]:
-    """
-    FastAPI TestClient with DB dependency overridden.
-    """
-    app.dependency_overrides[get_db] = override_get_db
-    with TestClient(app) as c:
-        yield c
-    app.dependency_overrides.clear()
 
 
 # ---------------------------------------------------------------------------
@@ -62,22 +10,6 @@ def client(monkeypatch, tmp_path) -> Generator[TestClient, None, None]:
 # ---------------------------------------------------------------------------
 
 
-def register_and_login(client: TestClient, email: str, password: str) -> str:
-    # Register
-    r = client.post("/api/v1/auth/register", data={"email": email, "password": password})
-    assert r.status_code == 201, r.text
-
-    # Login
-    r = client.post(
-        "/api/v1/auth/login",
-        data={"username": email, "password": password},
-        headers={"Content-Type": "application/x-www-form-urlencoded"},
-    )
-    assert r.status_code == 200, r.text
-    token = r.json()["access_token"]
-    return token
-
-
 def auth_headers(token: str) -> dict[str, str]:
     return {"Authorization": f"Bearer {token}"}
 
@@ -87,8 +19,8 @@ def auth_headers(token: str) -> dict[str, str]:
 # ---------------------------------------------------------------------------
 
 
-def test_create_and_list_targets(client: TestClient) -> None:
-    token = register_and_login(client, "targets1@example.com", "secret123")
+def test_create_and_list_targets(client: TestClient, token_factory) -> None:
+    token = token_factory("targets1@example.com")
 
     # Initially no targets
     r = client.get("/api/v1/targets/", headers=auth_headers(token))
@@ -113,8 +45,8 @@ def test_create_and_list_targets(client: TestClient) -> None:
     assert items[0]["id"] == target_id
 
 
-def test_delete_target(client: TestClient) -> None:
-    token = register_and_login(client, "targets2@example.com", "secret123")
+def test_delete_target(client: TestClient, token_factory) -> None:
+    token = token_factory("targets2@example.com")
 
     # Create target
     payload = {"url": "https://delete-me.com", "name": "To delete"}
@@ -133,9 +65,9 @@ def test_delete_target(client: TestClient) -> None:
     assert all(t["id"] != target_id for t in items)
 
 
-def test_cannot_delete_other_users_target(client: TestClient) -> None:
+def test_cannot_delete_other_users_target(client: TestClient, token_factory) -> None:
     # User A
-    token_a = register_and_login(client, "userA@example.com", "secret123")
+    token_a = token_factory("userA@example.com")
     r = client.post(
         "/api/v1/targets/",
         json={"url": "https://owner.com", "name": "Owner target"},
@@ -145,7 +77,7 @@ def test_cannot_delete_other_users_target(client: TestClient) -> None:
     target_id = r.json()["id"]
 
     # User B
-    token_b = register_and_login(client, "userB@example.com", "secret123")
+    token_b = token_factory("userB@example.com")
 
     # User B tries to delete User A's target
     r = client.delete(f"/api/v1/targets/{target_id}", headers=auth_headers(token_b))